@@ -1,4 +1,6 @@
 from abc import ABC
+from array import array
+from bisect import bisect_left, bisect_right
 from typing import Generic, TypeVar, Self
 
 
@@ -10,6 +12,9 @@ class Node(Generic[T]):
     Реализация Узла списка
     """
 
+    # Без __dict__ у каждого узла: значительно меньше памяти на узел
+    __slots__ = ('value', 'left', 'right', 'label')
+
     def __init__(self, value: T) -> None:
         """
         Конструктор
@@ -20,6 +25,56 @@ class Node(Generic[T]):
         self.value = value
         self.left: Self | None = None
         self.right: Self | None = None
+        # Метка порядка узла в списке, используется индексом значений
+        self.label: int = 0
+
+
+class NodePool(Generic[T]):
+    """
+    Пул узлов: хранит узлы, освобожденные списком,
+    и выдает их повторно вместо создания новых
+    """
+
+    def __init__(self, max_free: int = 1 << 16) -> None:
+        """
+        Конструктор
+
+        Постусловие: создан пустой пул, хранящий не более max_free свободных узлов
+        """
+
+        self._free: list[Node[T]] = []
+        self._max_free = max_free
+
+    def acquire(self, value: T) -> Node[T]:
+        """
+        Выдать узел со значением value: из пула, если он не пуст, иначе новый
+        """
+
+        if not self._free:
+            return Node(value)
+        node = self._free.pop()
+        node.value = value
+        return node
+
+    def release(self, node: Node[T]) -> None:
+        """
+        Вернуть узел в пул
+
+        Постусловие: узел не ссылается ни на значение, ни на соседей
+        """
+
+        node.value = None
+        node.left = None
+        node.right = None
+        if len(self._free) < self._max_free:
+            self._free.append(node)
+
+    def size(self) -> int:
+        """
+        Количество свободных узлов в пуле
+        """
+
+        return len(self._free)
 
 
 class AbstractParentList(ABC, Generic[T]):
@@ -231,11 +286,29 @@ class ParentList(AbstractParentList, Generic[T]):
     FIND_OK: int = 1
     FIND_ERR: int = 2
 
-    def __init__(self) -> None:
+    # Шаг между метками соседних узлов при перенумерации
+    LABEL_GAP: int = 1 << 32
+
+    def __init__(self, indexed: bool = False, pool: NodePool | None = None) -> None:
+        """
+        Конструктор
+
+        Постусловие: создан новый пустой связный список.
+                     При indexed=True поддерживается индекс значение -> узлы,
+                     значения должны быть hashable.
+                     Если задан pool, узлы берутся из него и возвращаются в него
+                     при remove и clear
+        """
 
         self._head: Node | None = None
         self._tail: Node | None = None
         self._cursor: Node | None = None
+        # Количество узлов поддерживается всеми командами, меняющими список
+        self._size: int = 0
+        # Индекс: значение -> список узлов с этим значением, упорядоченный по меткам
+        self._indexed: bool = indexed
+        self._pool: NodePool | None = pool
+        self._index: dict[T, list[Node]] = {}
 
         self._head_status: int = self.HEAD_OK
         self._tail_status: int = self.TAIL_OK
@@ -306,17 +379,21 @@ class ParentList(AbstractParentList, Generic[T]):
             self._put_right_status = self.PUT_RIGHT_ERR
 
         elif self.is_tail():
-            self._tail.right = Node(value)
+            self._tail.right = self._new_node(value)
             self._tail.right.left = self._tail
             self._tail = self._tail.right
+            self._size += 1
+            self._index_add(self._tail)
             self._put_right_status = self.PUT_RIGHT_OK
 
         else:
             next_node = self._cursor.right
-            self._cursor.right = Node(value)
+            self._cursor.right = self._new_node(value)
             self._cursor.right.left = self._cursor
             self._cursor.right.right = next_node
             next_node.left = self._cursor.right
+            self._size += 1
+            self._index_add(self._cursor.right)
             self._put_right_status = self.PUT_RIGHT_OK
 
     def put_left(self, value: T) -> None:
@@ -332,17 +409,21 @@ class ParentList(AbstractParentList, Generic[T]):
             self._put_left_status = self.PUT_LEFT_ERR
 
         elif self.is_head():
-            self._head.left = Node(value)
+            self._head.left = self._new_node(value)
             self._head.left.right = self._head
             self._head = self._head.left
+            self._size += 1
+            self._index_add(self._head)
             self._put_left_status = self.PUT_LEFT_OK
 
         else:
             left_node = self._cursor.left
-            self._cursor.left = Node(value)
+            self._cursor.left = self._new_node(value)
             self._cursor.left.right = self._cursor
             self._cursor.left.left = left_node
             left_node.right = self._cursor.left
+            self._size += 1
+            self._index_add(self._cursor.left)
             self._put_left_status = self.PUT_LEFT_OK
 
     def remove(self) -> None:
@@ -357,28 +438,9 @@ class ParentList(AbstractParentList, Generic[T]):
 
         if not self.is_value():
             self._remove_status = self.REMOVE_ERR
-
-        elif self.size() == 1:
-            self.clear()
-
-        elif self.is_tail():
-            self._tail = self._tail.left
-            self._tail.right = None
-            self._cursor = self._tail
-            self._remove_status = self.REMOVE_OK
-
-        elif self.is_head():
-            self._head = self._head.right
-            self._head.left = None
-            self._cursor = self._head
-            self._remove_status = self.REMOVE_OK
-
         else:
-            left_node = self._cursor.left
-            right_node = self._cursor.right
-            left_node.right = right_node
-            right_node.left = left_node
-            self._remove_status = self.REMOVE_OK
+            self._index_remove(self._cursor)
+            self._unlink()
 
     def clear(self) -> None:
         """
@@ -387,7 +449,13 @@ class ParentList(AbstractParentList, Generic[T]):
         Постусловие: список пустой
         """
 
-        self.__init__()
+        if self._pool is not None:
+            node = self._head
+            while node is not None:
+                next_node = node.right
+                self._pool.release(node)
+                node = next_node
+        self.__init__(self._indexed, self._pool)
 
     # Комманды
     # Сводимые к другим операции
@@ -400,9 +468,11 @@ class ParentList(AbstractParentList, Generic[T]):
 
         # Вставка в пустой список
         if not self.is_value():
-            self._head = Node(value)
+            self._head = self._new_node(value)
             self._tail = self._head
             self._cursor = self._head
+            self._size = 1
+            self._index_add(self._head)
         else:
             # Сделаем этот метод производным от put_right
             cursor = self._cursor
@@ -421,7 +491,9 @@ class ParentList(AbstractParentList, Generic[T]):
         if not self.is_value():
             self._replace_status = self.REPLACE_ERR
         else:
+            self._index_remove(self._cursor)
             self._cursor.value = value
+            self._index_add(self._cursor)
             self._replace_status = self.REPLACE_OK
 
     def find(self, value: T) -> None:
@@ -433,13 +505,16 @@ class ParentList(AbstractParentList, Generic[T]):
                      то курсор установлен на первый узел с таким значением
         """
 
-        if self.is_value():
+        if self._indexed:
+            self._find_indexed(value)
+        elif self.is_value():
             cursor = self._cursor
+            self.right()
             while self.get_right_status() == self.RIGHT_OK:
-                self.right()
                 if self.get() == value:
                     self._find_status = self.FIND_OK
                     return
+                self.right()
             # Put cursor back to original place
             self._cursor = cursor
             self._find_status = self.FIND_ERR
@@ -451,6 +526,10 @@ class ParentList(AbstractParentList, Generic[T]):
         Постусловие: в списке нет ни одного узла со значением value
         """
 
+        if self._indexed:
+            self._remove_all_indexed(value)
+            return
+
         self.head()
         if self.get_head_status() == self.HEAD_ERR:
             return
@@ -462,6 +541,140 @@ class ParentList(AbstractParentList, Generic[T]):
             else:
                 self.find(value)
 
+    # Скрытые команды
+    def _unlink(self) -> None:
+        """
+        Исключить текущий узел из списка, не трогая индекс значений
+        """
+
+        node = self._cursor
+        if self.size() == 1:
+            self.clear()
+            return
+
+        elif self.is_tail():
+            self._tail = self._tail.left
+            self._tail.right = None
+            self._cursor = self._tail
+            self._size -= 1
+            self._remove_status = self.REMOVE_OK
+
+        elif self.is_head():
+            self._head = self._head.right
+            self._head.left = None
+            self._cursor = self._head
+            self._size -= 1
+            self._remove_status = self.REMOVE_OK
+
+        else:
+            left_node = self._cursor.left
+            right_node = self._cursor.right
+            left_node.right = right_node
+            right_node.left = left_node
+            self._cursor = right_node
+            self._size -= 1
+            self._remove_status = self.REMOVE_OK
+
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _new_node(self, value: T) -> Node:
+        if self._pool is None:
+            return Node(value)
+        return self._pool.acquire(value)
+
+    # Индекс значений
+    def _index_add(self, node: Node) -> None:
+        """
+        Назначить узлу метку между соседями и добавить его в индекс
+        """
+
+        if not self._indexed:
+            return
+        left, right = node.left, node.right
+        if left is None and right is None:
+            node.label = 0
+        elif right is None:
+            node.label = left.label + self.LABEL_GAP
+        elif left is None:
+            node.label = right.label - self.LABEL_GAP
+        else:
+            node.label = (left.label + right.label) // 2
+            if node.label == left.label:
+                # Между соседями не осталось свободных меток
+                self._relabel_window(node)
+        nodes = self._index.setdefault(node.value, [])
+        nodes.insert(bisect_left(nodes, node.label, key=lambda n: n.label), node)
+
+    def _index_remove(self, node: Node) -> None:
+        if not self._indexed:
+            return
+        nodes = self._index[node.value]
+        nodes.pop(bisect_left(nodes, node.label, key=lambda n: n.label))
+        if not nodes:
+            del self._index[node.value]
+
+    def _relabel_window(self, node: Node) -> None:
+        """
+        Перенумеровать метки в окрестности node (порядок не меняется).
+        Окно вокруг узла удваивается, пока метки его внешних соседей не дадут
+        каждому узлу окна шаг не меньше размера окна (или окно не дойдет до края
+        списка, за которым метки не ограничены). Плотные участки перенумеровываются
+        локально, а не по всему списку
+        """
+
+        first = last = node
+        count = 1
+        while True:
+            for _ in range(count):
+                if first.left is not None:
+                    first = first.left
+                    count += 1
+                if last.right is not None:
+                    last = last.right
+                    count += 1
+            low, high = first.left, last.right
+            if low is None or high is None or high.label - low.label > count * (count + 1):
+                break
+
+        if low is None and high is None:
+            label, gap = 0, self.LABEL_GAP
+        elif low is None:
+            label, gap = high.label - count * self.LABEL_GAP, self.LABEL_GAP
+        elif high is None:
+            label, gap = low.label + self.LABEL_GAP, self.LABEL_GAP
+        else:
+            gap = (high.label - low.label) // (count + 1)
+            label = low.label + gap
+        current = first
+        while current is not high:
+            current.label = label
+            label += gap
+            current = current.right
+
+    def _find_indexed(self, value: T) -> None:
+        nodes = self._index.get(value)
+        if not self.is_value() or not nodes:
+            self._find_status = self.FIND_ERR
+            return
+        pos = bisect_right(nodes, self._cursor.label, key=lambda n: n.label)
+        if pos == len(nodes):
+            self._find_status = self.FIND_ERR
+        else:
+            self._cursor = nodes[pos]
+            self._find_status = self.FIND_OK
+
+    def _remove_all_indexed(self, value: T) -> None:
+        nodes = self._index.pop(value, [])
+        cursor = self._cursor
+        removed = False
+        for node in nodes:
+            removed = removed or node is cursor
+            self._cursor = node
+            self._unlink()
+        if not removed and self.is_value():
+            self._cursor = cursor
+
     # Запросы
     # Элементарные
 
@@ -470,16 +683,7 @@ class ParentList(AbstractParentList, Generic[T]):
         Посчитать количество узлов в списке.
         """
 
-        self.head()
-        if self.get_head_status() == self.HEAD_ERR:
-            cnt = 0
-        else:
-            cnt = 1
-            self.right()
-            while self.get_right_status() != self.RIGHT_ERR:
-                cnt += 1
-                self.right()
-        return cnt
+        return self._size
 
     def get(self) -> T | None:
         """
@@ -540,11 +744,11 @@ class ParentList(AbstractParentList, Generic[T]):
 
     def get_remove_status(self) -> int:
         """Возвращает статус выполнения команды remove"""
-        return self._putove_status
+        return self._remove_status
 
     def get_replace_status(self) -> int:
         """Возвращает статус выполнения команды replace"""
-        return self._putlace_status
+        return self._replace_status
 
     def get_find_status(self) -> int:
         """Возвращает статус выполнения команды find"""
@@ -568,14 +772,14 @@ class TwoWayList(ParentList):
     LEFT_OK: int = 1
     LEFT_ERR: int = 2
 
-    def __init__(self) -> None:
+    def __init__(self, indexed: bool = False, pool: NodePool | None = None) -> None:
         """
         Конструктор
 
         Постусловие: создан объект двусвязного списка
         """
 
-        super().__init__()
+        super().__init__(indexed, pool)
         self._left_status = self.LEFT_OK
 
     def left(self) -> None:
@@ -592,7 +796,348 @@ class TwoWayList(ParentList):
             self._left_status = self.LEFT_ERR
         else:
             self._cursor = self._cursor.left
-            self._right_status = self.LEFT_OK
+            self._left_status = self.LEFT_OK
 
     def get_left_status(self) -> int:
         """Возвращает статус выполнения команды left"""
+        return self._left_status
+
+
+class ArrayTwoWayList(AbstractParentList, Generic[T]):
+    """
+    Реализация двусвязного списка на параллельных массивах (structure of arrays):
+    значения, индексы левых и правых соседей хранятся в отдельных столбцах,
+    освободившиеся ячейки переиспользуются через стек свободных индексов.
+    Узел - это индекс в столбцах, NIL - отсутствие узла.
+    Пред- и постусловия совпадают с AbstractParentList
+    """
+
+    NIL: int = -1
+    LEFT_OK: int = 1
+    LEFT_ERR: int = 2
+
+    def __init__(self) -> None:
+        """
+        Конструктор
+
+        Постусловие: создан объект пустого двусвязного списка
+        """
+
+        self._values: list[T | None] = []
+        self._left: array = array('l')
+        self._right: array = array('l')
+        self._free: list[int] = []
+
+        self._head: int = self.NIL
+        self._tail: int = self.NIL
+        self._cursor: int = self.NIL
+        self._size: int = 0
+
+        self._head_status: int = self.HEAD_OK
+        self._tail_status: int = self.TAIL_OK
+        self._put_right_status: int = self.PUT_RIGHT_OK
+        self._put_left_status: int = self.PUT_LEFT_OK
+        self._right_status: int = self.RIGHT_OK
+        self._left_status: int = self.LEFT_OK
+        self._remove_status: int = self.REMOVE_OK
+        self._replace_status: int = self.REPLACE_OK
+        self._get_status: int = self.GET_OK
+        self._find_status: int = self.FIND_OK
+
+    # Комманды
+    # Элементарные операции
+    def head(self) -> None:
+        if not self.is_value():
+            self._head_status = self.HEAD_ERR
+        else:
+            self._cursor = self._head
+            self._head_status = self.HEAD_OK
+
+    def tail(self) -> None:
+        if not self.is_value():
+            self._tail_status = self.TAIL_ERR
+        else:
+            self._cursor = self._tail
+            self._tail_status = self.TAIL_OK
+
+    def right(self) -> None:
+        node = self._right[self._cursor] if self._cursor != self.NIL else self.NIL
+        if node == self.NIL:
+            self._right_status = self.RIGHT_ERR
+        else:
+            self._cursor = node
+            self._right_status = self.RIGHT_OK
+
+    def left(self) -> None:
+        node = self._left[self._cursor] if self._cursor != self.NIL else self.NIL
+        if node == self.NIL:
+            self._left_status = self.LEFT_ERR
+        else:
+            self._cursor = node
+            self._left_status = self.LEFT_OK
+
+    def put_right(self, value: T) -> None:
+        if not self.is_value():
+            self._put_right_status = self.PUT_RIGHT_ERR
+            return
+        next_node = self._right[self._cursor]
+        node = self._new_node(value, self._cursor, next_node)
+        self._right[self._cursor] = node
+        if next_node == self.NIL:
+            self._tail = node
+        else:
+            self._left[next_node] = node
+        self._put_right_status = self.PUT_RIGHT_OK
+
+    def put_left(self, value: T) -> None:
+        if not self.is_value():
+            self._put_left_status = self.PUT_LEFT_ERR
+            return
+        prev_node = self._left[self._cursor]
+        node = self._new_node(value, prev_node, self._cursor)
+        self._left[self._cursor] = node
+        if prev_node == self.NIL:
+            self._head = node
+        else:
+            self._right[prev_node] = node
+        self._put_left_status = self.PUT_LEFT_OK
+
+    def remove(self) -> None:
+        if not self.is_value():
+            self._remove_status = self.REMOVE_ERR
+            return
+        node = self._cursor
+        prev_node, next_node = self._left[node], self._right[node]
+        if prev_node == self.NIL:
+            self._head = next_node
+        else:
+            self._right[prev_node] = next_node
+        if next_node == self.NIL:
+            self._tail = prev_node
+        else:
+            self._left[next_node] = prev_node
+        self._cursor = next_node if next_node != self.NIL else prev_node
+        self._free_node(node)
+        self._remove_status = self.REMOVE_OK
+
+    def clear(self) -> None:
+        self.__init__()
+
+    # Комманды
+    # Сводимые к другим операции
+    def add_tail(self, value: T) -> None:
+        if not self.is_value():
+            node = self._new_node(value, self.NIL, self.NIL)
+            self._head = self._tail = self._cursor = node
+        else:
+            node = self._new_node(value, self._tail, self.NIL)
+            self._right[self._tail] = node
+            self._tail = node
+
+    def replace(self, value: T) -> None:
+        if not self.is_value():
+            self._replace_status = self.REPLACE_ERR
+        else:
+            self._values[self._cursor] = value
+            self._replace_status = self.REPLACE_OK
+
+    def find(self, value: T) -> None:
+        if not self.is_value():
+            self._find_status = self.FIND_ERR
+            return
+        values, right = self._values, self._right
+        node = right[self._cursor]
+        while node != self.NIL:
+            if values[node] == value:
+                self._cursor = node
+                self._find_status = self.FIND_OK
+                return
+            node = right[node]
+        self._find_status = self.FIND_ERR
+
+    def remove_all(self, value: T) -> None:
+        values, right = self._values, self._right
+        cursor = self._cursor
+        node = self._head
+        while node != self.NIL:
+            next_node = right[node]
+            if values[node] == value:
+                self._cursor = node
+                self.remove()
+                if node == cursor:
+                    cursor = self._cursor
+            node = next_node
+        self._cursor = cursor if self._size > 0 else self.NIL
+
+    # Запросы
+    # Элементарные
+    def size(self) -> int:
+        return self._size
+
+    def get(self) -> T | None:
+        if not self.is_value():
+            self._get_status = self.GET_ERR
+            return None
+        self._get_status = self.GET_OK
+        return self._values[self._cursor]
+
+    def is_value(self) -> bool:
+        return self._cursor != self.NIL
+
+    # Запросы
+    # Производные
+    def is_head(self) -> bool:
+        return self._head == self._cursor
+
+    def is_tail(self) -> bool:
+        return self._tail == self._cursor
+
+    # Запросы на статус выполенения команд
+    def get_head_status(self) -> int:
+        return self._head_status
+
+    def get_tail_status(self) -> int:
+        return self._tail_status
+
+    def get_right_status(self) -> int:
+        return self._right_status
+
+    def get_left_status(self) -> int:
+        return self._left_status
+
+    def get_put_right_status(self) -> int:
+        return self._put_right_status
+
+    def get_put_left_status(self) -> int:
+        return self._put_left_status
+
+    def get_remove_status(self) -> int:
+        return self._remove_status
+
+    def get_replace_status(self) -> int:
+        return self._replace_status
+
+    def get_find_status(self) -> int:
+        return self._find_status
+
+    def get_get_status(self) -> int:
+        return self._get_status
+
+    # Скрытые команды
+    def _new_node(self, value: T, left: int, right: int) -> int:
+        """
+        Занять ячейку (свободную или новую в конце столбцов) под узел
+        """
+
+        if self._free:
+            node = self._free.pop()
+            self._values[node] = value
+            self._left[node] = left
+            self._right[node] = right
+        else:
+            node = len(self._values)
+            self._values.append(value)
+            self._left.append(left)
+            self._right.append(right)
+        self._size += 1
+        return node
+
+    def _free_node(self, node: int) -> None:
+        self._values[node] = None
+        self._free.append(node)
+        self._size -= 1
+
+
+def _benchmark() -> None:
+    """
+    Время remove_all на списках разной длины:
+    при O(1) size() время растет линейно с числом узлов.
+    Память на узел (tracemalloc): узел с __dict__ против узла на __slots__
+    """
+    import time
+    import tracemalloc
+
+    for n in (25_000, 50_000, 100_000):
+        lst = TwoWayList()
+        for i in range(n):
+            lst.add_tail(i % 2)
+        start = time.perf_counter()
+        lst.remove_all(0)
+        elapsed = time.perf_counter() - start
+        print(f"n={n:>7}  remove_all: {elapsed:.4f}s  ({elapsed / n * 1e6:.2f} мкс/узел)")
+
+    # Вставки в одно место списка с индексом: метки перенумеровываются локально
+    for indexed in (False, True):
+        lst = TwoWayList(indexed=indexed)
+        for i in range(100_000):
+            lst.add_tail(i % 100)
+        lst.head()
+        for _ in range(50_000):
+            lst.right()
+        start = time.perf_counter()
+        for i in range(5_000):
+            lst.put_right(i % 7)
+        elapsed = time.perf_counter() - start
+        print(f"5000 put_right в одно место, indexed={indexed}: {elapsed:.4f}s")
+
+    class DictNode:
+        # Узел в прежнем виде: атрибуты хранятся в __dict__
+        def __init__(self, value) -> None:
+            self.value = value
+            self.left = None
+            self.right = None
+            self.label = 0
+
+    n = 100_000
+    for cls in (DictNode, Node):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        nodes = [cls(None) for _ in range(n)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # Вычитаем размер самого списка nodes
+        per_node = (after - before - nodes.__sizeof__()) / n
+        print(f"{cls.__name__:>8}: {per_node:.1f} байт/узел")
+        del nodes
+
+    pool = NodePool(max_free=n)
+    lst = TwoWayList(pool=pool)
+    for i in range(n):
+        lst.add_tail(i)
+    lst.clear()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(n):
+        lst.add_tail(0)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"NodePool: {(after - before) / n:.1f} байт/узел при повторном заполнении списка")
+
+    # Связный список на узлах против списка на параллельных массивах
+    n = 200_000
+    for cls in (TwoWayList, ArrayTwoWayList):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        lst = cls()
+        for _ in range(n):
+            lst.add_tail(0)
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        lst.head()
+        for _ in range(n - 1):
+            lst.right()
+        elapsed = time.perf_counter() - start
+        lst.head()
+        start = time.perf_counter()
+        lst.find(1)
+        find_elapsed = time.perf_counter() - start
+        print(
+            f"{cls.__name__:>15}: {(after - before) / n:.1f} байт/узел, "
+            f"обход right(): {elapsed:.4f}s, find без совпадений: {find_elapsed:.4f}s"
+        )
+        del lst
+
+
+if __name__ == '__main__':
+    _benchmark()
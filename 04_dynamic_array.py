@@ -1,5 +1,7 @@
+import copy
 import ctypes
-from typing import Protocol, Generic, TypeVar
+from array import array
+from typing import Iterable, Protocol, Generic, TypeVar
 
 
 T = TypeVar('T')
@@ -79,6 +81,62 @@ class AbsDynArray(Protocol, Generic[T]):
         """
         ...
 
+class ResizePolicy:
+    """
+    Политика изменения объема динамического массива с гистерезисом:
+    при заполнении объем умножается на grow_factor,
+    уменьшается в shrink_factor раз только когда заполненность падает ниже shrink_threshold,
+    и никогда не становится меньше базового объема.
+    Разрыв между порогами не дает массиву перевыделяться на каждой паре append/remove
+    """
+
+    def __init__(
+        self,
+        grow_factor: float = 2.0,
+        shrink_threshold: float = 0.25,
+        shrink_factor: float = 0.5,
+    ) -> None:
+        assert grow_factor > 1
+        assert 0 < shrink_factor < 1
+        # Иначе после уменьшения массив сразу окажется заполнен
+        assert 0 <= shrink_threshold < shrink_factor
+        self.grow_factor = grow_factor
+        self.shrink_threshold = shrink_threshold
+        self.shrink_factor = shrink_factor
+
+    def grow_capacity(self, capacity: int, needed: int) -> int:
+        """
+        Возвращает новый объем, в который помещается needed элементов
+        """
+        while capacity < needed:
+            capacity = max(capacity + 1, int(capacity * self.grow_factor))
+        return capacity
+
+    def shrink_capacity(self, capacity: int, count: int, base_capacity: int) -> int:
+        """
+        Возвращает объем после удаления (равен capacity, если уменьшать не нужно)
+        """
+        if capacity <= base_capacity or count >= capacity * self.shrink_threshold:
+            return capacity
+        return max(base_capacity, count, int(capacity * self.shrink_factor))
+
+
+# Элементы хранятся в закрытом буфере _array - списке длины capacity, свободные слоты равны None.
+# Сдвиг хвоста делают присваивание срезу и del: это перемещение блока
+# указателей на уровне C с правильным учетом ссылок, а сборщик мусора видит элементы,
+# так что циклы вида o.arr = a; a.append(o) освобождаются
+
+
+def _bounded_slice(start: int, stop: int, step: int) -> slice:
+    """
+    Срез по результату slice.indices(): при отрицательном шаге stop = -1 означает
+    "до начала", а в срезе отсчитался бы от конца буфера
+    """
+    if not range(start, stop, step):
+        return slice(0, 0)
+    return slice(start, stop if stop >= 0 else None, step)
+
+
 class DynArray(AbsDynArray, Generic[T]):
     INSERT_OK = 1
     INSERT_ERR = 0
@@ -86,20 +144,31 @@ class DynArray(AbsDynArray, Generic[T]):
     REMOVE_ERR = 0
 
     # Конструктор
-    def __init__(self, capacity=16) -> None:
+    def __init__(self, capacity=16, policy: ResizePolicy | None = None) -> None:
         self.capacity = capacity
         self.base_capacity = capacity
+        self.policy = ResizePolicy() if policy is None else policy
+        self._realloc_count = 0
+        self._array: list = [None] * capacity
         self.count: int = 0
-        self.array = (capacity * ctypes.py_object)()
 
         self._insert_status = self.INSERT_OK
         self._remove_status = self.REMOVE_OK
 
+    # Копирование: у каждой копии свой буфер, иначе правки одной были бы видны в другой
+    def __copy__(self) -> 'DynArray[T]':
+        return self._clone(self._array[:self.count])
+
+    def __deepcopy__(self, memo: dict) -> 'DynArray[T]':
+        new_array = self._clone([])
+        memo[id(self)] = new_array
+        new_array._clone_from([copy.deepcopy(item, memo) for item in self._array[:self.count]])
+        return new_array
+
     # Команды
     def append(self, item: T) -> None:
-        if self.count == self.capacity:
-            self._make_array(2 * self.capacity)
-        self.array[self.count] = item
+        self._reserve(self.count + 1)
+        self._array[self.count] = item
         self.count += 1
 
     def insert(self, item: T, index: int) -> None:
@@ -107,50 +176,696 @@ class DynArray(AbsDynArray, Generic[T]):
             self._insert_status = self.INSERT_ERR
             return
 
-        if self.count == self.capacity:
-            self._make_array(2 * self.capacity)
+        self._reserve(self.count + 1)
 
-        if index == self.count:
-            self.array[self.count] = item
-        else:
-            for i in range(self.count, index, -1):
-                self.array[i] = self.array[i - 1]
-            self.array[index] = item
+        # Сдвиг хвоста одним блоком (list.insert сдвигает поэлементным циклом,
+        # присваивание срезу - через memmove); последний слот после _reserve свободен
+        self._array[index:index] = (item,)
+        self._array.pop()
         self.count += 1
         self._insert_status = self.INSERT_OK
 
     def remove(self, index: int) -> None:
         if index < 0 or index >= self.count:
-            self._insert_status = self.REMOVE_ERR
+            self._remove_status = self.REMOVE_ERR
+            return
+
+        del self._array[index]
+        self._array.append(None)
+
+        self.count -= 1
+        self._shrink()
+        self._remove_status = self.REMOVE_OK
+
+    # Пакетные команды
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Вставка всех items в конец массива
+
+        Постусловие: объем массива увеличен один раз, сразу под все элементы
+        """
+        self.insert_many(items, self.count)
+
+    def insert_many(self, items: Iterable[T], index: int) -> None:
+        """
+        Вставка items подряд начиная с места index, хвост массива сдвигается один раз
+
+        Предусловие: значение index не меньше нуля и не больше, чем значение размера массива
+        """
+        if index < 0 or index > self.count:
+            self._insert_status = self.INSERT_ERR
+            return
+        items = list(items)
+        self._reserve(self.count + len(items))
+        self._array[index:index] = items
+        # Отбрасываются освободившиеся слоты в конце буфера
+        del self._array[self.capacity:]
+        self.count += len(items)
+        self._insert_status = self.INSERT_OK
+
+    def __setitem__(self, key: int | slice, value: T | Iterable[T]) -> None:
+        """
+        Замена элемента или среза.
+        Срез с шагом 1 может заменяться последовательностью другой длины,
+        срез с другим шагом - только последовательностью той же длины
+
+        Предусловие: индекс в пределах массива
+        """
+        if not isinstance(key, slice):
+            if key < 0 or key >= self.count:
+                raise IndexError(key)
+            self._array[key] = value
+            return
+
+        items = list(value)
+        start, stop, step = key.indices(self.count)
+        if step != 1:
+            if len(range(start, stop, step)) != len(items):
+                raise ValueError("Размер среза не совпадает с количеством элементов")
+            self._array[_bounded_slice(start, stop, step)] = items
+            return
+
+        stop = max(start, stop)
+        delta = len(items) - (stop - start)
+        self._reserve(self.count + delta)
+        self._array[start:stop] = items
+        if delta > 0:
+            del self._array[self.capacity:]
+        else:
+            self._array.extend([None] * -delta)
+        self.count += delta
+        self._set_resize_status(delta)
+
+    # Управление объемом
+    def reserve(self, capacity: int) -> None:
+        """
+        Постусловие: объем массива не меньше capacity
+        """
+        if capacity > self.capacity:
+            self._make_array(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Постусловие: объем массива равен количеству элементов (но не меньше 1)
+        """
+        if self.capacity != max(self.count, 1):
+            self._make_array(max(self.count, 1))
+
+    # Скрытые команды
+    def _shrink(self) -> None:
+        new_capacity = self.policy.shrink_capacity(self.capacity, self.count, self.base_capacity)
+        if new_capacity != self.capacity:
+            self._make_array(new_capacity)
+
+    def _reserve(self, needed: int) -> None:
+        """
+        Увеличивает объем по политике так, чтобы поместилось needed элементов
+        """
+        if needed > self.capacity:
+            self._make_array(self.policy.grow_capacity(self.capacity, needed))
+
+    def _set_resize_status(self, delta: int) -> None:
+        """
+        Статус замены среза: рост - как у вставки, сжатие - как у удаления (с уменьшением объема)
+        """
+        if delta < 0:
+            self._remove_status = self.REMOVE_OK
+            self._shrink()
+        else:
+            self._insert_status = self.INSERT_OK
+
+    def _clone(self, items: list[T]) -> 'DynArray[T]':
+        """
+        Новый массив того же объема и политики, заполненный items
+        """
+        new_array = self.__class__(self.capacity, self.policy)
+        new_array.base_capacity = self.base_capacity
+        new_array._clone_from(items)
+        return new_array
+
+    def _clone_from(self, items: list[T]) -> None:
+        self._reserve(len(items))
+        self._array[:len(items)] = items
+        self.count = len(items)
+
+    def _make_array(self, new_capacity: int) -> None:
+        new_array = self._array[:self.count]
+        new_array.extend([None] * (new_capacity - self.count))
+        self._array = new_array
+        self.capacity = new_capacity
+        self._realloc_count += 1
+
+    # Запросы
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            # Срез копирует только ссылки на элементы
+            return self._array[_bounded_slice(*index.indices(self.count))]
+        if index < 0 or index >= self.count:
+            raise IndexError(index)
+        return self._array[index]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get_realloc_count(self) -> int:
+        """
+        Количество перевыделений памяти под массив
+        """
+        return self._realloc_count
+
+    def get_insert_status(self) -> int:
+        return self._insert_status
+
+    def get_remove_status(self) -> int:
+        return self._remove_status
+
+
+class TypedDynArray(AbsDynArray, Generic[T]):
+    """
+    Динамический массив примитивных значений (int/float) без упаковки в объекты:
+    элементы лежат подряд в буфере array.array с кодом типа typecode ('i', 'q', 'd', ...)
+    """
+    INSERT_OK = 1
+    INSERT_ERR = 0
+    REMOVE_OK = 1
+    REMOVE_ERR = 0
+
+    # Конструктор
+    def __init__(
+        self,
+        capacity=16,
+        typecode: str = 'd',
+        policy: ResizePolicy | None = None,
+    ) -> None:
+        self.capacity = capacity
+        self.base_capacity = capacity
+        self.policy = ResizePolicy() if policy is None else policy
+        self._realloc_count = 0
+        self.typecode = typecode
+        self.count: int = 0
+        self.array = array(typecode, bytes(capacity * array(typecode).itemsize))
+
+        self._insert_status = self.INSERT_OK
+        self._remove_status = self.REMOVE_OK
+
+    # Команды
+    def append(self, item: T) -> None:
+        self._reserve(self.count + 1)
+        self.array[self.count] = item
+        self.count += 1
+
+    def insert(self, item: T, index: int) -> None:
+        if index < 0 or index > self.count:
+            self._insert_status = self.INSERT_ERR
             return
 
-        if (self.count -1) // self.capacity < 0.5:
-            self._make_array(max(self.base_capacity, self.capacity // 2))
+        self._reserve(self.count + 1)
 
-        for i in range(index, self.count - 1):
-            self.array[i] = self.array[i + 1]
+        self._move(index + 1, index, self.count - index)
+        self.array[index] = item
+        self.count += 1
+        self._insert_status = self.INSERT_OK
 
+    def remove(self, index: int) -> None:
+        if index < 0 or index >= self.count:
+            self._remove_status = self.REMOVE_ERR
+            return
+
+        self._move(index, index + 1, self.count - index - 1)
         self.count -= 1
-        self._insert_status = self.REMOVE_OK
+        self._shrink()
+        self._remove_status = self.REMOVE_OK
+
+    # Пакетные команды
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Вставка всех items в конец массива, объем увеличивается один раз
+        """
+        self.insert_many(items, self.count)
+
+    def insert_many(self, items: Iterable[T], index: int) -> None:
+        """
+        Вставка items подряд начиная с места index, хвост массива сдвигается один раз
+        """
+        if index < 0 or index > self.count:
+            self._insert_status = self.INSERT_ERR
+            return
+        items = array(self.typecode, items)
+        n = len(items)
+        self._reserve(self.count + n)
+        self._move(index + n, index, self.count - index)
+        self._store_many(index, items)
+        self.count += n
+        self._insert_status = self.INSERT_OK
+
+    def __setitem__(self, key: int | slice, value: T | Iterable[T]) -> None:
+        """
+        Замена элемента или среза (правила как у DynArray.__setitem__)
+        """
+        if not isinstance(key, slice):
+            if key < 0 or key >= self.count:
+                raise IndexError(key)
+            self.array[key] = value
+            return
+
+        items = array(self.typecode, value)
+        start, stop, step = key.indices(self.count)
+        if step != 1:
+            if len(range(start, stop, step)) != len(items):
+                raise ValueError("Размер среза не совпадает с количеством элементов")
+            # Срез берется по самому key: stop = -1 после indices() memoryview
+            # отсчитал бы от конца
+            if items:
+                with self.memoryview() as view:
+                    view[key] = memoryview(items)
+            return
+
+        stop = max(start, stop)
+        delta = len(items) - (stop - start)
+        self._reserve(self.count + delta)
+        self._move(start + len(items), stop, self.count - stop)
+        self._store_many(start, items)
+        self.count += delta
+        if delta < 0:
+            self._remove_status = self.REMOVE_OK
+            self._shrink()
+        else:
+            self._insert_status = self.INSERT_OK
+
+    # Управление объемом
+    def reserve(self, capacity: int) -> None:
+        """
+        Постусловие: объем массива не меньше capacity
+        """
+        if capacity > self.capacity:
+            self._make_array(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Постусловие: объем массива равен количеству элементов (но не меньше 1)
+        """
+        if self.capacity != max(self.count, 1):
+            self._make_array(max(self.count, 1))
 
     # Скрытые команды
+    def _shrink(self) -> None:
+        new_capacity = self.policy.shrink_capacity(self.capacity, self.count, self.base_capacity)
+        if new_capacity != self.capacity:
+            self._make_array(new_capacity)
+
+    def _reserve(self, needed: int) -> None:
+        """
+        Увеличивает объем по политике так, чтобы поместилось needed элементов
+        """
+        if needed > self.capacity:
+            self._make_array(self.policy.grow_capacity(self.capacity, needed))
+
+    def _move(self, dst: int, src: int, length: int) -> None:
+        """
+        Перемещает length элементов начиная с src в позицию dst (диапазоны могут перекрываться).
+        Копирование идет через memoryview: присваивание срезу самого array.array,
+        даже пустому, считается изменением размера и падает с BufferError,
+        пока жив хотя бы один выданный memoryview
+        """
+        if length <= 0 or dst == src:
+            return
+        with memoryview(self.array) as view:
+            view[dst:dst + length] = view[src:src + length]
+
+    def _store_many(self, index: int, items: array) -> None:
+        """
+        Записывает items начиная с index (через memoryview, как и _move)
+        """
+        if not items:
+            return
+        with memoryview(self.array) as view:
+            view[index:index + len(items)] = memoryview(items)
+
     def _make_array(self, new_capacity: int) -> None:
-        new_array = (new_capacity * ctypes.py_object)()
-        for i in range(self.count):
-            new_array[i] = self.array[i]
+        # Новый буфер, а не изменение размера старого: выданные ранее memoryview
+        # продолжают ссылаться на старый буфер, и array не блокируется экспортом
+        new_array = array(self.typecode, bytes(new_capacity * self.array.itemsize))
+        new_array[:self.count] = self.array[:self.count]
         self.array = new_array
         self.capacity = new_capacity
+        self._realloc_count += 1
 
     # Запросы
-    def __getitem__(self, index: int) -> T:
+    def __getitem__(self, index: int | slice) -> T | memoryview:
+        if isinstance(index, slice):
+            # Срез - представление буфера без копирования
+            return self.memoryview()[index]
+        if index < 0 or index >= self.count:
+            raise IndexError(index)
         return self.array[index]
 
     def __len__(self) -> int:
         return self.count
 
+    def memoryview(self) -> memoryview:
+        """
+        Возвращает memoryview на count элементов без копирования
+        (для передачи в NumPy, struct и т.п.).
+        Действителен до первого изменения объема массива
+        """
+        return memoryview(self.array)[:self.count]
+
+    def get_realloc_count(self) -> int:
+        """
+        Количество перевыделений памяти под массив
+        """
+        return self._realloc_count
+
     def get_insert_status(self) -> int:
         return self._insert_status
 
     def get_remove_status(self) -> int:
         return self._remove_status
 
+
+class GapDynArray(AbsDynArray, Generic[T]):
+    """
+    Динамический массив с разрывом (gap buffer):
+    свободное место хранится не в конце, а в разрыве на месте последней правки.
+    Вставки и удаления рядом с последней правкой стоят O(1) амортизированно,
+    разрыв перемещается лениво - только при правке в другом месте
+    """
+    INSERT_OK = 1
+    INSERT_ERR = 0
+    REMOVE_OK = 1
+    REMOVE_ERR = 0
+
+    # Конструктор
+    def __init__(self, capacity=16, policy: ResizePolicy | None = None) -> None:
+        self.capacity = capacity
+        self.base_capacity = capacity
+        self.policy = ResizePolicy() if policy is None else policy
+        self.count: int = 0
+        self._buffer: list[T | None] = [None] * capacity
+        # Разрыв - полуинтервал [_gap_start, _gap_end)
+        self._gap_start = 0
+        self._gap_end = capacity
+        self._realloc_count = 0
+
+        self._insert_status = self.INSERT_OK
+        self._remove_status = self.REMOVE_OK
+
+    # Команды
+    def append(self, item: T) -> None:
+        self.insert(item, self.count)
+
+    def insert(self, item: T, index: int) -> None:
+        if index < 0 or index > self.count:
+            self._insert_status = self.INSERT_ERR
+            return
+
+        self._reserve(self.count + 1)
+        self._move_gap(index)
+        self._buffer[self._gap_start] = item
+        self._gap_start += 1
+        self.count += 1
+        self._insert_status = self.INSERT_OK
+
+    def remove(self, index: int) -> None:
+        if index < 0 or index >= self.count:
+            self._remove_status = self.REMOVE_ERR
+            return
+
+        self._move_gap(index)
+        self._buffer[self._gap_end] = None
+        self._gap_end += 1
+        self.count -= 1
+        self._shrink()
+        self._remove_status = self.REMOVE_OK
+
+    # Управление объемом
+    def reserve(self, capacity: int) -> None:
+        """
+        Постусловие: объем массива не меньше capacity
+        """
+        if capacity > self.capacity:
+            self._make_array(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Постусловие: объем массива равен количеству элементов (но не меньше 1)
+        """
+        if self.capacity != max(self.count, 1):
+            self._make_array(max(self.count, 1))
+
+    # Скрытые команды
+    def _move_gap(self, index: int) -> None:
+        """
+        Перемещает разрыв так, чтобы он начинался с логического индекса index
+        """
+        buffer = self._buffer
+        if index < self._gap_start:
+            n = self._gap_start - index
+            buffer[self._gap_end - n:self._gap_end] = buffer[index:self._gap_start]
+            # Очищаем освободившиеся слоты, не задевая перекрытие с местом назначения
+            clear_end = min(self._gap_start, self._gap_end - n)
+            buffer[index:clear_end] = [None] * (clear_end - index)
+            self._gap_start -= n
+            self._gap_end -= n
+        elif index > self._gap_start:
+            n = index - self._gap_start
+            buffer[self._gap_start:index] = buffer[self._gap_end:self._gap_end + n]
+            clear_start = max(self._gap_end, index)
+            buffer[clear_start:self._gap_end + n] = [None] * (self._gap_end + n - clear_start)
+            self._gap_start += n
+            self._gap_end += n
+
+    def _reserve(self, needed: int) -> None:
+        if needed > self.capacity:
+            self._make_array(self.policy.grow_capacity(self.capacity, needed))
+
+    def _shrink(self) -> None:
+        new_capacity = self.policy.shrink_capacity(self.capacity, self.count, self.base_capacity)
+        if new_capacity != self.capacity:
+            self._make_array(new_capacity)
+
+    def _make_array(self, new_capacity: int) -> None:
+        # Разрыв остается на месте и забирает весь прирост (или убыль) объема
+        gap = new_capacity - self.count
+        self._buffer = (
+            self._buffer[:self._gap_start]
+            + [None] * gap
+            + self._buffer[self._gap_end:]
+        )
+        self._gap_end = self._gap_start + gap
+        self.capacity = new_capacity
+        self._realloc_count += 1
+
+    # Запросы
+    def __getitem__(self, index: int) -> T:
+        if index < 0 or index >= self.count:
+            raise IndexError(index)
+        if index >= self._gap_start:
+            index += self._gap_end - self._gap_start
+        return self._buffer[index]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get_realloc_count(self) -> int:
+        """
+        Количество перевыделений памяти под массив
+        """
+        return self._realloc_count
+
+    def get_insert_status(self) -> int:
+        return self._insert_status
+
+    def get_remove_status(self) -> int:
+        return self._remove_status
+
+
+def _benchmark() -> None:
+    """
+    Вставка в начало массива из 10^5 элементов:
+    поэлементный сдвиг в цикле против сдвига блоком через memmove
+    """
+    import time
+
+    class LoopDynArray:
+        # Прежняя реализация: py_object-слоты и сдвиг в цикле
+        def __init__(self, capacity=16) -> None:
+            self.capacity = capacity
+            self.count = 0
+            self.array = (capacity * ctypes.py_object)()
+
+        def append(self, item) -> None:
+            if self.count == self.capacity:
+                self._make_array(2 * self.capacity)
+            self.array[self.count] = item
+            self.count += 1
+
+        def insert(self, item, index: int) -> None:
+            if self.count == self.capacity:
+                self._make_array(2 * self.capacity)
+            for i in range(self.count, index, -1):
+                self.array[i] = self.array[i - 1]
+            self.array[index] = item
+            self.count += 1
+
+        def _make_array(self, new_capacity: int) -> None:
+            new_array = (new_capacity * ctypes.py_object)()
+            for i in range(self.count):
+                new_array[i] = self.array[i]
+            self.array = new_array
+            self.capacity = new_capacity
+
+    n = 10 ** 5
+    for cls, inserts in ((LoopDynArray, 50), (DynArray, 5000)):
+        arr = cls()
+        for i in range(n):
+            arr.append(i)
+        start = time.perf_counter()
+        for i in range(inserts):
+            arr.insert(i, 0)
+        elapsed = time.perf_counter() - start
+        print(f"{cls.__name__:>12}: {inserts / elapsed:,.0f} вставок/с в начало при n={n}")
+
+    # Чередование append/remove на границе объема: число перевыделений
+    arr = DynArray()
+    for i in range(64):
+        arr.append(i)
+    reallocs = arr.get_realloc_count()
+    for _ in range(10 ** 4):
+        arr.append(0)
+        arr.remove(len(arr) - 1)
+    print(f"Перевыделений на 10^4 пар append/remove: {arr.get_realloc_count() - reallocs}")
+
+    # Загрузка 10^6 элементов: append в цикле против одного extend
+    items = list(range(10 ** 6))
+    for cls in (DynArray, TypedDynArray):
+        arr = cls()
+        start = time.perf_counter()
+        for item in items:
+            arr.append(item)
+        append_elapsed = time.perf_counter() - start
+        arr = cls()
+        start = time.perf_counter()
+        arr.extend(items)
+        extend_elapsed = time.perf_counter() - start
+        print(
+            f"{cls.__name__:>13}: append x10^6 {append_elapsed:.3f}s, "
+            f"extend {extend_elapsed:.3f}s"
+        )
+
+    # Редактирование "случайным блужданием": позиция правки смещается
+    # на несколько элементов, затем вставка или удаление
+    import random
+
+    n = 10 ** 5
+    edits = 20_000
+    rng = random.Random(0)
+    steps = [(rng.randint(-8, 8), rng.random() < 0.6) for _ in range(edits)]
+    for cls in (DynArray, GapDynArray):
+        arr = cls()
+        for i in range(n):
+            arr.append(i)
+        pos = n // 2
+        start = time.perf_counter()
+        for step, is_insert in steps:
+            pos = min(max(pos + step, 0), len(arr) - 1)
+            if is_insert:
+                arr.insert(0, pos)
+            else:
+                arr.remove(pos)
+        elapsed = time.perf_counter() - start
+        print(f"{cls.__name__:>13}: {edits / elapsed:,.0f} правок/с при n={n}")
+
+    # Память на элемент для массива float: объекты в куче против сырого буфера
+    import tracemalloc
+
+    for make in (lambda: DynArray(), lambda: TypedDynArray(typecode='d')):
+        tracemalloc.start()
+        arr = make()
+        for i in range(n):
+            arr.append(i * 0.5)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{type(arr).__name__:>13}: {used / n:.1f} байт/элемент (float)")
+        del arr
+
+
+def _check_refcounts() -> None:
+    """
+    Проверка учета ссылок DynArray через публичный интерфейс: после копирования,
+    pickle и удаления всех массивов счетчик ссылок элемента возвращается к исходному,
+    а массив в цикле ссылок с собственным элементом освобождается сборщиком мусора
+    """
+    import gc
+    import pickle
+    import sys
+    import weakref
+
+    item = object()
+    before = sys.getrefcount(item)
+    arr = DynArray()
+    for _ in range(10):
+        arr.append(item)
+    arr.insert(item, 3)
+    arr.remove(0)
+    arr[2:4] = [item, item, item]
+    arr[::-2] = [item] * len(arr[::-2])
+    shallow = copy.copy(arr)
+    deep = copy.deepcopy([arr, item])
+    assert deep[0][0] is deep[1]
+    assert sys.getrefcount(item) == before + 2 * len(arr)
+    del arr
+    del shallow
+    del deep
+    assert sys.getrefcount(item) == before
+
+    restored = pickle.loads(pickle.dumps(DynArray()))
+    assert len(restored) == 0
+    values = DynArray()
+    values.extend(["a", "b", "c"])
+    restored = pickle.loads(pickle.dumps(values))
+    assert restored[:] == ["a", "b", "c"] and restored[::-1] == ["c", "b", "a"]
+
+    class Node:
+        pass
+
+    node = Node()
+    node.arr = DynArray()
+    node.arr.append(node)
+    ref = weakref.ref(node)
+    del node
+    gc.collect()
+    assert ref() is None
+    print("DynArray: счетчики ссылок сходятся, циклы собираются")
+
+
+def _check_slices() -> None:
+    """
+    Чтение и замена срезов с любым шагом (в том числе отрицательным)
+    у DynArray и TypedDynArray совпадают со списком
+    """
+    import random
+
+    rng = random.Random(0)
+    for cls in (DynArray, TypedDynArray):
+        for n in (0, 1, 5, 13):
+            reference = [float(i) for i in range(n)]
+            arr = cls()
+            arr.extend(reference)
+            for _ in range(300):
+                key = slice(
+                    rng.choice([None, *range(-n - 2, n + 2)]),
+                    rng.choice([None, *range(-n - 2, n + 2)]),
+                    rng.choice([None, -3, -2, -1, 1, 2, 3]),
+                )
+                assert list(arr[key]) == reference[key], key
+                values = [float(rng.randint(0, 99)) for _ in reference[key]]
+                reference[key] = values
+                arr[key] = values
+                assert list(arr[:]) == reference, key
+    print("Срезы DynArray и TypedDynArray совпадают со списком")
+
+if __name__ == '__main__':
+    _check_refcounts()
+    _check_slices()
+    _benchmark()
@@ -100,3 +100,127 @@ class Queue(AbstractQueue, Generic[T]):
     def get_peek_status(self) -> int:
         return self._peek_status
 
+
+# Очередь на кольцевом буфере: индекс головы двигается по кругу,
+# поэтому enqueue и dequeue не сдвигают элементы и работают за амортизированное O(1)
+class RingQueue(AbstractQueue, Generic[T]):
+    DEQUEUE_NIL = 0
+    DEQUEUE_OK = 1
+    DEQUEUE_ERR = 2
+    PEEK_NIL = 0
+    PEEK_OK = 1
+    PEEK_ERR = 2
+    # Для буфера фиксированного размера enqueue может не выполниться
+    ENQUEUE_NIL = 0
+    ENQUEUE_OK = 1
+    ENQUEUE_ERR = 2
+
+
+    # Constructor
+    def __init__(self, capacity: int = 16, fixed: bool = False) -> None:
+        """
+        Постусловие: создается пустая очередь с буфером на capacity элементов,
+                     при fixed=True буфер не растет
+        """
+        assert capacity > 0, "Размер буфера - положительное число"
+        self._base_capacity = capacity
+        self._fixed = fixed
+        self._buffer: list[T | None] = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self._enqueue_status = self.ENQUEUE_NIL
+        self._dequeue_status = self.DEQUEUE_NIL
+        self._peek_status = self.PEEK_NIL
+
+    # Commands
+    def enqueue(self, value: T) -> None: 
+        """
+        Предусловие: в буфере фиксированного размера есть свободное место
+        Постусловие: добавлен новый элемент value в начало очереди
+        """
+        if self._count == len(self._buffer):
+            if self._fixed:
+                self._enqueue_status = self.ENQUEUE_ERR
+                return
+            self._grow()
+        tail = (self._head + self._count) % len(self._buffer)
+        self._buffer[tail] = value
+        self._count += 1
+        self._enqueue_status = self.ENQUEUE_OK
+
+    def dequeue(self) -> None: 
+        if self._count == 0:
+            self._dequeue_status = self.DEQUEUE_ERR
+            return
+        # Освобождаем ссылку, чтобы не удерживать объект в буфере
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % len(self._buffer)
+        self._count -= 1
+        self._dequeue_status = self.DEQUEUE_OK
+
+    def clear(self) -> None: 
+        self.__init__(self._base_capacity, self._fixed)
+
+    # Queries
+    def size(self) -> int: 
+        return self._count
+
+    def peek(self) -> T | int: 
+        if self._count == 0:
+            self._peek_status = self.PEEK_ERR
+            return 0
+        self._peek_status = self.PEEK_OK
+        return self._buffer[self._head]
+
+    def get_enqueue_status(self) -> int:
+        """
+        Возвращает статус выполения команды enqueue
+        """
+        return self._enqueue_status
+
+    def get_dequeue_status(self) -> int:
+        return self._dequeue_status
+
+    def get_peek_status(self) -> int:
+        return self._peek_status
+
+    # Скрытые команды
+    def _grow(self) -> None:
+        """
+        Увеличивает буфер в 2 раза, разворачивая элементы так, чтобы голова была в нуле
+        """
+        capacity = len(self._buffer)
+        self._buffer = (
+            self._buffer[self._head:]
+            + self._buffer[:self._head]
+            + [None] * capacity
+        )
+        self._head = 0
+
+
+def _benchmark() -> None:
+    """
+    Сравнение Queue (list.insert) и RingQueue: n раз enqueue, затем n раз dequeue
+    """
+    import time
+
+    # Для Queue время растет квадратично, поэтому большие размеры пропускаем
+    list_limit = 10 ** 5
+    for n in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        row = [f"n={n:>8}"]
+        for cls in (Queue, RingQueue):
+            if cls is Queue and n > list_limit:
+                row.append(f"{cls.__name__}: пропущено")
+                continue
+            queue = cls()
+            start = time.perf_counter()
+            for i in range(n):
+                queue.enqueue(i)
+            for _ in range(n):
+                queue.dequeue()
+            row.append(f"{cls.__name__}: {time.perf_counter() - start:.4f}s")
+        print("  ".join(row))
+
+
+if __name__ == '__main__':
+    _benchmark()
@@ -177,3 +177,164 @@ class Deque(ParentQueue, Generic[T]):
     def get_get_tail_status(self) -> int:
         return self._get_tail_status
 
+
+
+# Блок из фиксированного числа слотов для BlockDeque
+class _Block(Generic[T]):
+    __slots__ = ('data', 'left', 'right')
+
+    def __init__(self, size: int) -> None:
+        self.data: list[T | None] = [None] * size
+        self.left: _Block[T] | None = None
+        self.right: _Block[T] | None = None
+
+
+# Реализация деки на связанных блоках фиксированного размера (как deque в CPython).
+# Голова (front) - левый край, хвост (tail) - правый край.
+# Память выделяется не на каждый элемент, а на блок из BLOCK_LEN слотов,
+# поэтому все команды добавления и удаления выполняются за O(1)
+class BlockDeque(AbstractDeque, Generic[T]):
+    BLOCK_LEN = 64
+
+    REMOVE_FRONT_NIL = 0
+    REMOVE_FRONT_OK = 1
+    REMOVE_FRONT_ERR = 2
+    GET_FRONT_NIL = 0
+    GET_FRONT_OK = 1
+    GET_FRONT_ERR = 2
+    REMOVE_TAIL_NIL = 0
+    REMOVE_TAIL_OK = 1
+    REMOVE_TAIL_ERR = 2
+    GET_TAIL_NIL = 0
+    GET_TAIL_OK = 1
+    GET_TAIL_ERR = 2
+
+    # Constructor
+    def __init__(self) -> None:
+        block = _Block(self.BLOCK_LEN)
+        self._left_block: _Block[T] = block
+        self._right_block: _Block[T] = block
+        # Пустая дека: левый индекс на единицу правее правого
+        self._left_index = self.BLOCK_LEN // 2
+        self._right_index = self._left_index - 1
+        self._size = 0
+        # Один освобожденный блок держим про запас, чтобы не выделять память
+        # заново при колебаниях размера около границы блока
+        self._spare_block: _Block[T] | None = None
+
+        self._remove_front_status = self.REMOVE_FRONT_NIL
+        self._get_front_status = self.GET_FRONT_NIL
+        self._remove_tail_status = self.REMOVE_TAIL_NIL
+        self._get_tail_status = self.GET_TAIL_NIL
+
+    # Commands
+    def add_tail(self, value: T) -> None:
+        if self._right_index == self.BLOCK_LEN - 1:
+            block = self._new_block()
+            block.left = self._right_block
+            self._right_block.right = block
+            self._right_block = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right_block.data[self._right_index] = value
+        self._size += 1
+
+    def add_front(self, value: T) -> None:
+        if self._left_index == 0:
+            block = self._new_block()
+            block.right = self._left_block
+            self._left_block.left = block
+            self._left_block = block
+            self._left_index = self.BLOCK_LEN
+        self._left_index -= 1
+        self._left_block.data[self._left_index] = value
+        self._size += 1
+
+    def remove_front(self) -> None:
+        if self._size == 0:
+            self._remove_front_status = self.REMOVE_FRONT_ERR
+            return
+        self._left_block.data[self._left_index] = None
+        self._left_index += 1
+        self._size -= 1
+        if self._size == 0:
+            self._recenter()
+        elif self._left_index == self.BLOCK_LEN:
+            block = self._left_block
+            self._left_block = block.right
+            self._left_block.left = None
+            self._left_index = 0
+            self._free_block(block)
+        self._remove_front_status = self.REMOVE_FRONT_OK
+
+    def remove_tail(self) -> None:
+        if self._size == 0:
+            self._remove_tail_status = self.REMOVE_TAIL_ERR
+            return
+        self._right_block.data[self._right_index] = None
+        self._right_index -= 1
+        self._size -= 1
+        if self._size == 0:
+            self._recenter()
+        elif self._right_index == -1:
+            block = self._right_block
+            self._right_block = block.left
+            self._right_block.right = None
+            self._right_index = self.BLOCK_LEN - 1
+            self._free_block(block)
+        self._remove_tail_status = self.REMOVE_TAIL_OK
+
+    def clear(self) -> None:
+        self.__init__()
+
+    # Queries
+    def size(self) -> int:
+        return self._size
+
+    def get_front(self) -> T | int:
+        if self._size == 0:
+            self._get_front_status = self.GET_FRONT_ERR
+            return 0
+        self._get_front_status = self.GET_FRONT_OK
+        return self._left_block.data[self._left_index]
+
+    def get_tail(self) -> T | int:
+        if self._size == 0:
+            self._get_tail_status = self.GET_TAIL_ERR
+            return 0
+        self._get_tail_status = self.GET_TAIL_OK
+        return self._right_block.data[self._right_index]
+
+    def get_remove_front_status(self) -> int:
+        return self._remove_front_status
+
+    def get_get_front_status(self) -> int:
+        return self._get_front_status
+
+    def get_remove_tail_status(self) -> int:
+        return self._remove_tail_status
+
+    def get_get_tail_status(self) -> int:
+        return self._get_tail_status
+
+    # Скрытые команды
+    def _new_block(self) -> _Block[T]:
+        if self._spare_block is not None:
+            block, self._spare_block = self._spare_block, None
+            return block
+        return _Block(self.BLOCK_LEN)
+
+    def _free_block(self, block: _Block[T]) -> None:
+        block.left = None
+        block.right = None
+        self._spare_block = block
+
+    def _recenter(self) -> None:
+        """
+        Дека опустела: оставляем один блок и ставим индексы в его середину
+        """
+        self._left_block.left = None
+        self._left_block.right = None
+        self._right_block = self._left_block
+        self._left_index = self.BLOCK_LEN // 2
+        self._right_index = self._left_index - 1
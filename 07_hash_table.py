@@ -1,3 +1,4 @@
+import random
 from typing import Protocol, TypeVar, Generic
 
 
@@ -53,16 +54,61 @@ class AbstractHashTable(Protocol, Generic[T]):
         ...
 
 
+# Пометка удаленного слота (tombstone).
+# В отличие от None, не обрывает цепочку пробирования для других значений
+_DELETED = object()
+
+
 class HashTable(AbstractHashTable, Generic[T]):
     PUT_OK = 0
     PUT_ERR = 1
     DELETE_OK = 0
     DELETE_ERR = 1
 
+    # Движки хэширования
+    # HASH_LENGTH - исходная функция по длине строки, с линейным шагом 2
+    # HASH_BUILTIN - встроенный hash() с треугольным пробированием
+    # HASH_SEEDED - hash(), перемешанный с сидом (финализатор splitmix64),
+    #               с треугольным пробированием
+    HASH_LENGTH = 0
+    HASH_BUILTIN = 1
+    HASH_SEEDED = 2
+
+    _MASK_64 = (1 << 64) - 1
+
     # Конструктор
-    def __init__(self, max_size: int) -> None:
+    def __init__(
+        self,
+        max_size: int,
+        engine: int = HASH_BUILTIN,
+        seed: int | None = None,
+        tombstone_threshold: float = 0.25,
+    ) -> None:
+        """
+        Постусловие: создан объект хэш-таблицы с заданным максимальным размером
+                     и выбранным движком хэширования engine.
+                     Когда доля удаленных слотов превышает tombstone_threshold,
+                     таблица уплотняется
+        """
+        assert max_size > 0, "Размер таблицы - положительное число"
+        assert engine in (self.HASH_LENGTH, self.HASH_BUILTIN, self.HASH_SEEDED)
+        assert 0 < tombstone_threshold <= 1
         self._max_size = max_size
-        self._array = []
+        self._engine = engine
+        self._seed = random.getrandbits(64) if seed is None else seed
+        self._tombstone_threshold = tombstone_threshold
+        if engine == self.HASH_LENGTH:
+            self._table_size = max_size
+        else:
+            # Треугольное пробирование обходит все слоты
+            # только в таблице размером степень двойки; запас вдвое держит
+            # заполнение не выше 1/2, иначе промах isin в полной таблице
+            # пробирует все слоты
+            self._table_size = 1 << (2 * max_size - 1).bit_length()
+        self._array: list[T | object | None] = [None] * self._table_size
+        self._count = 0
+        self._deleted = 0
+        self._compact_count = 0
         self._put_status = self.PUT_OK
         self._delete_status = self.DELETE_OK
 
@@ -71,28 +117,61 @@ class HashTable(AbstractHashTable, Generic[T]):
         res = self._seek_slot(value)
         if res == -1:
             self._put_status = self.PUT_ERR
-        else:
-            self._array[res] = value
+            return
+        slot = self._array[res]
+        if slot is not None and slot is not _DELETED:
             self._put_status = self.PUT_OK
+            return
+        if self._count == self._max_size:
+            self._put_status = self.PUT_ERR
+            return
+        if slot is _DELETED:
+            self._deleted -= 1
+        self._array[res] = value
+        self._count += 1
+        self._put_status = self.PUT_OK
 
     def delete(self, value: T) -> None:
         res = self._seek_slot(value)
-        if res == -1:
+        if res == -1 or self._array[res] is None or self._array[res] is _DELETED:
             self._delete_status = self.DELETE_ERR
-        else:
-            self._array[res] = None
-            self._delete_status = self.DELETE_OK
+            return
+        self._array[res] = _DELETED
+        self._count -= 1
+        self._deleted += 1
+        self._delete_status = self.DELETE_OK
+        if self._deleted > self._tombstone_threshold * self._table_size:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Постусловие: удаленные слоты убраны, цепочки пробирования перестроены
+        """
+        items = [slot for slot in self._array if slot is not None and slot is not _DELETED]
+        self._array = [None] * self._table_size
+        self._deleted = 0
+        for item in items:
+            self._array[self._seek_slot(item)] = item
+        self._compact_count += 1
 
     def clear(self) -> None:
-        self.__init__(self._max_size)
+        self.__init__(self._max_size, self._engine, self._seed, self._tombstone_threshold)
 
     # Запросы
     def __len__(self) -> int:
-        return len(self._array)
+        return self._count
 
     def isin(self, value: T) -> bool:
         res = self._seek_slot(value)
-        return res != -1
+        return res != -1 and self._array[res] is not None and self._array[res] is not _DELETED
+
+    def get_tombstone_ratio(self) -> float:
+        """Возвращает долю удаленных слотов в таблице"""
+        return self._deleted / self._table_size
+
+    def get_compact_count(self) -> int:
+        """Возвращает количество выполненных уплотнений"""
+        return self._compact_count
 
     def get_put_status(self) -> int:
         return self._put_status
@@ -105,22 +184,40 @@ class HashTable(AbstractHashTable, Generic[T]):
         """
         Hash Функция
         """
+        if self._engine == self.HASH_BUILTIN:
+            return hash(value) & (self._table_size - 1)
+        if self._engine == self.HASH_SEEDED:
+            x = (hash(value) ^ self._seed) & self._MASK_64
+            x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & self._MASK_64
+            x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & self._MASK_64
+            return (x ^ (x >> 31)) & (self._table_size - 1)
         byte_len = len(str(value).encode('utf-8'))
         hash_ = byte_len % self._max_size
         return hash_
 
     def _seek_slot(self, value: T) -> int:
         """
-        Функция для нахождения слота в массиве
+        Функция для нахождения слота в массиве:
+        возвращает индекс слота со значением value, а если его нет -
+        индекс первого удаленного или пустого слота на пути пробирования
         """
+        linear = self._engine == self.HASH_LENGTH
+        mask = self._table_size - 1
         index = self._hash_func(value)
-        counter = 0
-        while counter < self._max_size:
+        free = -1
+        # Смещения 0, 1, 3, 6, ... (треугольные числа) при размере 2^k
+        # обходят каждый слот ровно один раз
+        for step in range(1, self._table_size + 1):
             slot = self._array[index]
-            
-            if (slot is None) or (slot == value):
+            if slot is None:
+                return index if free == -1 else free
+            if slot is _DELETED:
+                if free == -1:
+                    free = index
+            elif slot == value:
                 return index
-            index = (index + 2) % self._max_size
-            counter += 1
-            
-        return -1
+            if linear:
+                index = (index + 2) % self._max_size
+            else:
+                index = (index + step) & mask
+        return free
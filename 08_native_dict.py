@@ -65,6 +65,11 @@ class AbstractNativeDictionary(Protocol, Generic[T]):
         ...
 
 
+# Пометка слота, из которого ключ удален или перенесен при рехэшировании.
+# В отличие от None, не обрывает цепочку пробирования
+_DELETED = object()
+
+
 class NativeDictionary(AbstractNativeDictionary, Generic[T]):
     PUT_OK = 0
     PUT_ERR = 1
@@ -74,10 +79,52 @@ class NativeDictionary(AbstractNativeDictionary, Generic[T]):
     GET_ERR = 1
 
     # Конструктор
-    def __init__(self, max_size: int) -> None:
+    def __init__(
+        self,
+        max_size: int,
+        max_load_factor: float = 0.75,
+        min_load_factor: float = 0.1875,
+        rehash_step: int = 4,
+        tombstone_threshold: float = 0.25,
+    ) -> None:
+        """
+        Постусловие: создан пустой словарь с начальным размером таблицы не меньше max_size.
+                     Таблица растет в 2 раза, когда заполненность превышает max_load_factor,
+                     и уменьшается в 2 раза (но не меньше начального размера),
+                     когда заполненность падает ниже min_load_factor; после уменьшения
+                     заполненность не выше max_load_factor / 2, чтобы таблица
+                     не росла обратно сразу.
+                     Рехэширование идет постепенно: каждая команда put/delete
+                     переносит rehash_step слотов, а если запаса новой таблицы до порога
+                     на это не хватит - столько, чтобы старая таблица опустела раньше.
+                     Когда доля удаленных слотов превышает tombstone_threshold,
+                     таблица постепенно уплотняется рехэшированием в тот же размер
+        """
+        assert max_size > 0, "Размер таблицы - положительное число"
+        assert 0 < min_load_factor < max_load_factor < 1
+        assert rehash_step > 0
+        assert 0 < tombstone_threshold <= 1
         self._max_size = max_size
-        self._slots: list[str | None] = [None] * self._max_size
-        self._values: list[T | None] = [None] * self._max_size
+        self._max_load_factor = max_load_factor
+        self._min_load_factor = min_load_factor
+        self._rehash_step = rehash_step
+        self._tombstone_threshold = tombstone_threshold
+        # Размер таблицы - степень двойки, чтобы треугольное пробирование обходило все слоты
+        self._base_size = 1 << (max_size - 1).bit_length()
+        self._slots: list[str | object | None] = [None] * self._base_size
+        self._values: list[T | None] = [None] * self._base_size
+        # Таблица, в которую идет рехэширование (None, если рехэширования нет)
+        self._new_slots: list[str | object | None] | None = None
+        self._new_values: list[T | None] | None = None
+        self._rehash_index = 0
+        # Сколько слотов переносит одна команда в текущем рехэшировании
+        self._rehash_batch = rehash_step
+        self._count = 0
+        # Количество непустых (включая удаленные) слотов в таблице, принимающей вставки
+        self._filled = 0
+        self._grow_count = 0
+        self._shrink_count = 0
+        self._compact_count = 0
         self._put_status = self.PUT_OK
         self._delete_status = self.DELETE_OK
         self._get_status = self.GET_OK
@@ -87,63 +134,218 @@ class NativeDictionary(AbstractNativeDictionary, Generic[T]):
         """
         Hash Функция
         """
-        byte_len = len(key.encode('utf-8'))
-        return byte_len % self._max_size
+        return hash(key)
 
-    def _seek_slot(self, key: str) -> int:
+    def _probe(self, slots: list, key: str) -> tuple[int, int]:
         """
-        Функция для нахождения слота в массиве
+        Пробирование таблицы slots по ключу key.
+        Возвращает индекс слота с ключом (или -1)
+        и индекс первого слота, подходящего для вставки (или -1)
         """
-        index = self._hash_func(key)
-        counter = 0
-        while counter < self._max_size:
-            slot = self._slots[index]
-            if (slot is None) or (slot == key):
-                return index
-            index = (index + 2) % self._max_size
-            counter += 1
-        return -1
+        mask = len(slots) - 1
+        index = self._hash_func(key) & mask
+        free = -1
+        for step in range(1, len(slots) + 1):
+            slot = slots[index]
+            if slot is None:
+                return -1, (index if free == -1 else free)
+            if slot is _DELETED:
+                if free == -1:
+                    free = index
+            elif slot == key:
+                return index, free
+            index = (index + step) & mask
+        return -1, free
+
+    def _locate(self, key: str) -> tuple[list | None, list | None, int]:
+        """
+        Находит таблицу и слот с ключом key, при рехэшировании ищет в обеих таблицах
+        """
+        if self._new_slots is not None:
+            index, _ = self._probe(self._new_slots, key)
+            if index != -1:
+                return self._new_slots, self._new_values, index
+        index, _ = self._probe(self._slots, key)
+        if index != -1:
+            return self._slots, self._values, index
+        return None, None, -1
+
+    def _target(self) -> tuple[list, list]:
+        """
+        Таблица, принимающая новые ключи
+        """
+        if self._new_slots is not None:
+            return self._new_slots, self._new_values
+        return self._slots, self._values
+
+    def _start_rehash(self, new_size: int) -> None:
+        """
+        Начинает перенос в таблицу размера new_size.
+        В новую таблицу попадут не больше _count перенесенных ключей и по одному
+        слоту на каждый put, так что до порога max_load_factor остается
+        не меньше headroom команд; за это время старая таблица должна опустеть.
+        Поэтому новый порог во время переноса не достигается
+        и рехэширования не накладываются друг на друга
+        """
+        assert self._new_slots is None, "Предыдущее рехэширование не завершено"
+        headroom = int(self._max_load_factor * new_size) - self._count
+        self._rehash_batch = max(self._rehash_step, -(-len(self._slots) // max(headroom, 1)))
+        self._new_slots = [None] * new_size
+        self._new_values = [None] * new_size
+        self._rehash_index = 0
+        self._filled = 0
+
+    def _rehash(self, steps: int) -> None:
+        """
+        Переносит не более steps слотов из старой таблицы в новую
+        """
+        if self._new_slots is None:
+            return
+        end = min(self._rehash_index + steps, len(self._slots))
+        for i in range(self._rehash_index, end):
+            key = self._slots[i]
+            if key is None or key is _DELETED:
+                continue
+            _, free = self._probe(self._new_slots, key)
+            if self._new_slots[free] is None:
+                self._filled += 1
+            self._new_slots[free] = key
+            self._new_values[free] = self._values[i]
+            # Оставляем пометку, чтобы не разорвать цепочки еще не перенесенных ключей
+            self._slots[i] = _DELETED
+            self._values[i] = None
+        self._rehash_index = end
+        if end == len(self._slots):
+            self._slots, self._values = self._new_slots, self._new_values
+            self._new_slots, self._new_values = None, None
+
+    def _rehash_all(self) -> None:
+        self._rehash(len(self._slots))
 
     # Команды
     def put(self, key: str, value: T) -> None:
-        res = self._seek_slot(key)
-        if res == -1:
-            self._put_status = self.PUT_ERR
-        else:
-            self._slots[res] = key
-            self._values[res] = value
+        self._rehash(self._rehash_batch)
+        slots, values, index = self._locate(key)
+        if index != -1:
+            values[index] = value
             self._put_status = self.PUT_OK
+            return
+
+        slots, values = self._target()
+        _, free = self._probe(slots, key)
+        if free == -1:
+            self._put_status = self.PUT_ERR
+            return
+        if slots[free] is None:
+            self._filled += 1
+        slots[free] = key
+        values[free] = value
+        self._count += 1
+        self._put_status = self.PUT_OK
+
+        if self._filled > self._max_load_factor * len(slots) and self._new_slots is None:
+            if 2 * self._count < self._filled:
+                # Заполнение в основном за счет удаленных слотов - увеличивать незачем
+                self._compact_count += 1
+                self._start_rehash(len(slots))
+            else:
+                self._grow_count += 1
+                self._start_rehash(2 * len(slots))
 
     def delete(self, key: str) -> None:
-        res = self._seek_slot(key)
-        if res == -1:
+        self._rehash(self._rehash_batch)
+        slots, values, index = self._locate(key)
+        if index == -1:
             self._delete_status = self.DELETE_ERR
-        else:
-            self._slots[res] = None
-            self._values[res] = None
-            self._delete_status = self.DELETE_OK
+            return
+        slots[index] = _DELETED
+        values[index] = None
+        self._count -= 1
+        self._delete_status = self.DELETE_OK
+
+        if self._new_slots is None:
+            size = len(self._slots)
+            new_size = size
+            # Уменьшение идет, пока таблица недогружена и после уменьшения вдвое
+            # заполнится не больше чем на max_load_factor / 2
+            while (
+                new_size > self._base_size
+                and self._count < self._min_load_factor * new_size
+                and 4 * self._count <= self._max_load_factor * new_size
+            ):
+                new_size //= 2
+            if new_size < size:
+                self._shrink_count += 1
+                self._start_rehash(new_size)
+            elif self._filled - self._count > self._tombstone_threshold * size:
+                self._compact_count += 1
+                self._start_rehash(size)
+
+    def compact(self) -> None:
+        """
+        Постусловие: рехэширование завершено, удаленные слоты убраны,
+                     цепочки пробирования перестроены
+        """
+        self._rehash_all()
+        self._start_rehash(len(self._slots))
+        self._rehash_all()
+        self._compact_count += 1
 
     def clear(self) -> None:
-        self.__init__(self._max_size)
+        self.__init__(
+            self._max_size,
+            self._max_load_factor,
+            self._min_load_factor,
+            self._rehash_step,
+            self._tombstone_threshold,
+        )
 
     # Запросы
     def __len__(self) -> int:
-        return len(list(filter(lambda x: x is not None, self._slots)))
+        return self._count
 
     def is_key(self, key: str) -> bool:
-        res = self._seek_slot(key)
-        return res != -1
+        _, _, index = self._locate(key)
+        return index != -1
 
     def get(self, key: str) -> T | int:
-        res = self._seek_slot(key)
-        if res == -1:
+        _, values, index = self._locate(key)
+        if index == -1:
             self._get_status = self.GET_ERR
             result = -1
         else:
-            result = self._values[res]
+            result = values[index]
             self._get_status = self.GET_OK
         return result
 
+    def get_load_factor(self) -> float:
+        """Возвращает заполненность таблицы, принимающей вставки"""
+        slots, _ = self._target()
+        return self._count / len(slots)
+
+    def get_grow_count(self) -> int:
+        """Возвращает количество увеличений таблицы"""
+        return self._grow_count
+
+    def get_shrink_count(self) -> int:
+        """Возвращает количество уменьшений таблицы"""
+        return self._shrink_count
+
+    def get_tombstone_ratio(self) -> float:
+        """Возвращает долю удаленных слотов в таблице, принимающей вставки"""
+        if self._new_slots is not None:
+            # Во время рехэширования живые ключи распределены по двум таблицам
+            return 0.0
+        return (self._filled - self._count) / len(self._slots)
+
+    def get_compact_count(self) -> int:
+        """Возвращает количество уплотнений таблицы"""
+        return self._compact_count
+
+    def is_rehashing(self) -> bool:
+        """Идет ли сейчас постепенное рехэширование"""
+        return self._new_slots is not None
+
     # Запросы выполнения команд
     def get_put_status(self) -> int:
         return self._put_status
@@ -153,4 +355,3 @@ class NativeDictionary(AbstractNativeDictionary, Generic[T]):
 
     def get_get_status(self) -> int:
         return self._get_status
-
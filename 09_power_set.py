@@ -1,5 +1,9 @@
 from __future__ import annotations
-from typing import Protocol, Generic, TypeVar
+from bisect import bisect_left
+import hashlib
+from heapq import heappush, heapreplace, merge
+import math
+from typing import Iterator, Protocol, Generic, TypeVar
 
 
 T = TypeVar('T')
@@ -18,21 +22,59 @@ class AbstractHashTable(Protocol, Generic[T]):
 
     # Запросы
     def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[T]: ...
     def isin(self, value: T) -> bool: ...
     def get_put_status(self) -> int: ...
     def get_delete_status(self) -> int: ...
 
 
+# Пометка удаленного слота (tombstone).
+# В отличие от None, не обрывает цепочку пробирования для других значений
+_DELETED = object()
+
+
+def _iter_bits(bitmap: bytearray) -> Iterator[int]:
+    """
+    Обходит номера установленных битов битовой карты (длина кратна 8 байтам),
+    пропуская нулевые 64-битные слова целиком
+    """
+    for word_index, word in enumerate(memoryview(bitmap).cast('Q')):
+        if not word:
+            continue
+        base = word_index << 6
+        # Порядок байт слова не зависит от платформы
+        word = int.from_bytes(bitmap[base >> 3:(base >> 3) + 8], 'little')
+        while word:
+            low = word & -word
+            yield base + low.bit_length() - 1
+            word ^= low
+
+
 class HashTable(AbstractHashTable, Generic[T]):
     PUT_OK = 0
     PUT_ERR = 1
     DELETE_OK = 0
     DELETE_ERR = 1
 
+    # Минимальный размер таблицы: одно 64-битное слово битовой карты занятости
+    _MIN_TABLE_SIZE = 64
+
     # Конструктор
     def __init__(self, max_size: int) -> None:
+        """
+        Постусловие: создана пустая таблица на max_size значений.
+                     Размер таблицы - степень двойки не меньше 2 * max_size,
+                     поэтому заполненность не превышает половины
+        """
+        assert max_size >= 0, "Размер таблицы - неотрицательное число"
         self._max_size = max_size
-        self._array = []
+        self._table_size = self._fit_table_size(max_size)
+        self._array: list[T | object | None] = [None] * self._table_size
+        # Битовая карта занятых слотов: бит i установлен, если в слоте i лежит значение.
+        # Позволяет обходить значения, пропуская пустые слоты по 64 за раз
+        self._occupied = bytearray(self._table_size >> 3)
+        self._count = 0
+        self._deleted = 0
         self._put_status = self.PUT_OK
         self._delete_status = self.DELETE_OK
 
@@ -41,28 +83,51 @@ class HashTable(AbstractHashTable, Generic[T]):
         res = self._seek_slot(value)
         if res == -1:
             self._put_status = self.PUT_ERR
-        else:
-            self._array[res] = value
+            return
+        slot = self._array[res]
+        if slot is not None and slot is not _DELETED:
             self._put_status = self.PUT_OK
+            return
+        if self._count == self._max_size:
+            self._put_status = self.PUT_ERR
+            return
+        if slot is _DELETED:
+            self._deleted -= 1
+        self._array[res] = value
+        self._occupied[res >> 3] |= 1 << (res & 7)
+        self._count += 1
+        self._put_status = self.PUT_OK
 
     def remove(self, value: T) -> None:
         res = self._seek_slot(value)
-        if res == -1:
+        if res == -1 or self._array[res] is None or self._array[res] is _DELETED:
             self._delete_status = self.DELETE_ERR
-        else:
-            self._array[res] = None
-            self._delete_status = self.DELETE_OK
+            return
+        self._array[res] = _DELETED
+        self._occupied[res >> 3] &= ~(1 << (res & 7))
+        self._count -= 1
+        self._deleted += 1
+        self._delete_status = self.DELETE_OK
+        # Удаленные слоты удлиняют пробирование: при их избытке таблица перестраивается
+        if self._deleted > self._table_size >> 2:
+            self._rebuild(self._table_size)
 
     def clear(self) -> None:
         self.__init__(self._max_size)
 
     # Запросы
     def __len__(self) -> int:
-        return len(self._array)
+        return self._count
+
+    def __iter__(self) -> Iterator[T]:
+        """Обходит значения по битовой карте занятости"""
+        array = self._array
+        for index in _iter_bits(self._occupied):
+            yield array[index]
 
     def isin(self, value: T) -> bool:
         res = self._seek_slot(value)
-        return res != -1
+        return res != -1 and self._array[res] is not None and self._array[res] is not _DELETED
 
     def get_put_status(self) -> int:
         return self._put_status
@@ -71,29 +136,95 @@ class HashTable(AbstractHashTable, Generic[T]):
         return self._delete_status
 
     # Вспомогательные функции
+    @classmethod
+    def _fit_table_size(cls, max_size: int) -> int:
+        """
+        Размер таблицы для max_size значений: степень двойки, кратная 64
+        """
+        return max(cls._MIN_TABLE_SIZE, 1 << (2 * max_size - 1).bit_length())
+
     def _hash_func(self, value: T) -> int:
         """
         Hash Функция
         """
-        byte_len = len(str(value).encode('utf-8'))
-        hash_ = byte_len % self._max_size
-        return hash_
+        return hash(value) & (self._table_size - 1)
 
     def _seek_slot(self, value: T) -> int:
         """
-        Функция для нахождения слота в массиве
+        Функция для нахождения слота в массиве:
+        возвращает индекс слота со значением value, а если его нет -
+        индекс первого удаленного или пустого слота на пути пробирования
         """
+        array = self._array
+        mask = self._table_size - 1
         index = self._hash_func(value)
-        counter = 0
-        while counter < self._max_size:
-            slot = self._array[index]
-            
-            if (slot is None) or (slot == value):
+        free = -1
+        # Смещения 0, 1, 3, 6, ... (треугольные числа) при размере 2^k
+        # обходят каждый слот ровно один раз
+        for step in range(1, self._table_size + 1):
+            slot = array[index]
+            if slot is None:
+                return index if free == -1 else free
+            if slot is _DELETED:
+                if free == -1:
+                    free = index
+            elif slot == value:
                 return index
-            index = (index + 2) % self._max_size
-            counter += 1
-            
-        return -1
+            index = (index + step) & mask
+        return free
+
+    def _copy(self, max_size: int) -> HashTable[T]:
+        """
+        Копия таблицы с емкостью не меньше max_size значений.
+        Если текущая таблица достаточно велика и в ней мало удаленных слотов,
+        массивы копируются целиком, без повторного хэширования
+        """
+        max_size = max(max_size, self._count)
+        new_table = self._empty(max_size)
+        if new_table._table_size <= self._table_size and self._deleted <= self._count:
+            new_table._table_size = self._table_size
+            new_table._array = self._array.copy()
+            new_table._occupied = bytearray(self._occupied)
+            new_table._count = self._count
+            new_table._deleted = self._deleted
+        else:
+            for item in self:
+                new_table.put(item)
+        return new_table
+
+    def _reserve(self, max_size: int) -> None:
+        """
+        Расширяет емкость до max_size значений, перестраивая таблицу только при нехватке слотов
+        """
+        if max_size <= self._max_size:
+            return
+        self._max_size = max_size
+        table_size = self._fit_table_size(max_size)
+        if table_size > self._table_size:
+            self._rebuild(table_size)
+
+    def _rebuild(self, table_size: int, items: list[T] | None = None) -> None:
+        """
+        Перекладывает значения (по умолчанию - текущие) в таблицу размера table_size
+        без удаленных слотов
+        """
+        if items is None:
+            items = list(self)
+        self._table_size = table_size
+        self._array = [None] * table_size
+        self._occupied = bytearray(table_size >> 3)
+        self._count = len(items)
+        self._deleted = 0
+        for item in items:
+            res = self._seek_slot(item)
+            self._array[res] = item
+            self._occupied[res >> 3] |= 1 << (res & 7)
+
+    def _empty(self, max_size: int) -> HashTable[T]:
+        """
+        Пустая таблица того же типа на max_size значений
+        """
+        return type(self)(max_size)
 
 class AbstractPowerSet(AbstractHashTable, Protocol, Generic[T]):
 
@@ -126,36 +257,826 @@ class AbstractPowerSet(AbstractHashTable, Protocol, Generic[T]):
 
     def issubset(self, other: AbstractPowerSet[T]) -> bool:
         """
-        Возвращает, является ли агрумент other подмножеством текущего множества
+        Возвращает, является ли текущее множество подмножеством аргумента other
+        """
+        ...
+
+    def union_all(self, *others: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        """
+        создает объект AbstractPowerSet как объединение текущего множества и всех аргументов
+        """
+        ...
+
+    # Команды
+    # Изменяют текущее множество на месте, не создавая новых объектов -
+    # для циклов, где множество многократно объединяется или сужается
+
+    def update(self, other: AbstractPowerSet[T]) -> None:
+        """
+        Постусловие: в текущее множество добавлены все значения other
+        """
+        ...
+
+    def intersection_update(self, other: AbstractPowerSet[T]) -> None:
+        """
+        Постусловие: в текущем множестве остались только значения, входящие в other
         """
         ...
 
+    def difference_update(self, other: AbstractPowerSet[T]) -> None:
+        """
+        Постусловие: из текущего множества удалены все значения other
+        """
+        ...
+
+
+class SetSketch:
+    """
+    Вероятностные сводки множества для оценок без обхода таблиц:
+    регистры HyperLogLog (оценка количества значений) и
+    k минимальных хэшей (оценка коэффициента Жаккара).
+    Сводка только накапливает значения: удаление в ней не отражается
+    """
+
+    _MASK_64 = (1 << 64) - 1
+    # Слагаемые 2^-r для суммы по регистрам HyperLogLog
+    _POW2_NEG = [2.0 ** -rank for rank in range(65)]
+
+    # Конструктор
+    def __init__(self, precision: int = 12, minhash_size: int = 256) -> None:
+        """
+        Постусловие: создана пустая сводка с 2^precision регистрами
+                     и сигнатурой из minhash_size минимальных хэшей
+        """
+        assert 4 <= precision <= 16
+        assert minhash_size > 0
+        self._precision = precision
+        self._minhash_size = minhash_size
+        self._registers = bytearray(1 << precision)
+        # Сигнатура: куча с обратным знаком (наибольший хэш сверху) и множество для дублей
+        self._heap: list[int] = []
+        self._minhashes: set[int] = set()
+
+    # Команды
+    def add(self, value: object) -> None:
+        h = self._hash(value)
+        index = h >> (64 - self._precision)
+        rest = (h << self._precision) & self._MASK_64
+        # Номер первой единицы в оставшихся битах, считая от старшего
+        rank = 65 - rest.bit_length() if rest else 65 - self._precision
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+        if h in self._minhashes:
+            return
+        if len(self._heap) < self._minhash_size:
+            heappush(self._heap, -h)
+            self._minhashes.add(h)
+        elif h < -self._heap[0]:
+            self._minhashes.discard(-heapreplace(self._heap, -h))
+            self._minhashes.add(h)
+
+    # Запросы
+    def copy(self) -> SetSketch:
+        new_sketch = SetSketch(self._precision, self._minhash_size)
+        new_sketch._registers[:] = self._registers
+        new_sketch._heap = self._heap.copy()
+        new_sketch._minhashes = self._minhashes.copy()
+        return new_sketch
+
+    def is_compatible(self, other: SetSketch) -> bool:
+        """Возвращает, построены ли сводки с одинаковыми параметрами"""
+        return self._precision == other._precision and self._minhash_size == other._minhash_size
+
+    def estimate_len(self) -> float:
+        """Оценка количества значений по регистрам HyperLogLog"""
+        return self._estimate(self._registers)
+
+    def estimate_union_len(self, other: SetSketch) -> float:
+        """Оценка размера объединения: поэлементный максимум регистров"""
+        return self._estimate(bytes(map(max, self._registers, other._registers)))
+
+    def estimate_jaccard(self, other: SetSketch) -> float:
+        """
+        Оценка коэффициента Жаккара: доля общих хэшей среди
+        k минимальных хэшей объединения
+        """
+        union = sorted(self._minhashes | other._minhashes)[:self._minhash_size]
+        if not union:
+            return 1.0
+        common = sum(1 for h in union if h in self._minhashes and h in other._minhashes)
+        return common / len(union)
+
+    # Вспомогательные функции
+    def _estimate(self, registers: bytes) -> float:
+        m = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(map(self._POW2_NEG.__getitem__, registers))
+        zeros = registers.count(0)
+        # Поправка для малых множеств: линейный подсчет по пустым регистрам
+        if estimate <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return estimate
+
+    @classmethod
+    def _hash(cls, value: object) -> int:
+        """
+        64-битный хэш: ключ значения с финализатором splitmix64,
+        чтобы близкие целые давали независимые биты
+        """
+        x = (cls._key(value) + 0x9E3779B97F4A7C15) & cls._MASK_64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & cls._MASK_64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & cls._MASK_64
+        return x ^ (x >> 31)
+
+    @classmethod
+    def _key(cls, value: object) -> int:
+        """
+        64-битный ключ значения. hash() для целых не подходит: hash(-1) == hash(-2),
+        а большие целые сворачиваются по модулю 2^61 - 1.
+        Поэтому целые (и равные им float) берутся как есть, а вне 64 бит -
+        через blake2b их байт; кортежи - по ключам элементов; остальное - hash()
+        """
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if isinstance(value, int):
+            if -(1 << 63) <= value < 1 << 63:
+                return value & cls._MASK_64
+            data = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+            return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+        if isinstance(value, tuple):
+            key = len(value)
+            for item in value:
+                key = cls._hash(key ^ cls._key(item))
+            return key
+        return hash(value) & cls._MASK_64
+
 
 class PowerSet(AbstractPowerSet, HashTable, Generic[T]):
 
-    def intersection(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]: 
-        new_set = PowerSet(max_size=max(len(self), len(other)))
-        for item in self._array:
-            if other.isin(item):
+    # Обходится меньшее из двух множеств, проверки идут в большее:
+    # операции выполняются за O(min(|A|, |B|)) проверок isin.
+    # Размер результата считается по количеству значений, а не слотов
+
+    # Конструктор
+    def __init__(
+        self,
+        max_size: int,
+        sketch: bool = False,
+        precision: int = 12,
+        minhash_size: int = 256,
+    ) -> None:
+        """
+        Постусловие: создано пустое множество на max_size значений.
+                     При sketch=True put ведет сводку SetSketch
+                     для приближенных запросов approx_*
+        """
+        super().__init__(max_size)
+        self._sketch_params = (sketch, precision, minhash_size)
+        self._sketch = SetSketch(precision, minhash_size) if sketch else None
+        # В сводке есть удаленные значения: ее стоит пересчитать при перестройке таблицы
+        self._sketch_stale = False
+
+    # Команды
+    def put(self, value: T) -> None:
+        super().put(value)
+        if self._sketch is not None and self._put_status == self.PUT_OK:
+            self._sketch.add(value)
+
+    def remove(self, value: T) -> None:
+        if self._sketch is not None and self.isin(value):
+            self._sketch_stale = True
+        super().remove(value)
+
+    def clear(self) -> None:
+        self.__init__(self._max_size, *self._sketch_params)
+
+    # Запросы
+    def intersection(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        new_set = self._empty(len(small))
+        for item in small:
+            if large.isin(item):
                 new_set.put(item)
         return new_set
 
     def union(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
-        new_set = PowerSet(max_size=(len(self) + len(other)))
-        for item in self._array:
-            new_set.put(item)
-        # this is wrong
-        for item in other._array:
+        if len(self) >= len(other) or not isinstance(other, HashTable):
+            large, small = self, other
+        else:
+            large, small = other, self
+        # Большее множество копируется массивами, меньшее досыпается по одному
+        new_set = large._copy(len(self) + len(other))
+        for item in small:
             new_set.put(item)
         return new_set
 
     def difference(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
-        new_set = PowerSet(max_size=len(self))
-        for item in self._array:
-            if not other.isin(item):
+        if len(self) <= len(other):
+            new_set = self._empty(len(self))
+            for item in self:
+                if not other.isin(item):
+                    new_set.put(item)
+            return new_set
+        # Другое множество меньше: копируем текущее и удаляем из копии
+        new_set = self._copy(len(self))
+        for item in other:
+            new_set.remove(item)
+        return new_set
+
+    def issubset(self, other: AbstractPowerSet[T]) -> bool:
+        if len(self) > len(other):
+            return False
+        return all(other.isin(item) for item in self)
+
+    def union_all(self, *others: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        # Размер результата считается один раз, самая большая таблица копируется массивами
+        sets = (self,) + others
+        total = sum(len(item) for item in sets)
+        large = max((item for item in sets if isinstance(item, HashTable)), key=len)
+        new_set = large._copy(total)
+        for other in sets:
+            if other is not large:
+                for item in other:
+                    new_set.put(item)
+        return new_set
+
+    # Приближенные запросы по сводкам, за O(размер сводки).
+    # Предусловие: оба множества созданы с sketch=True и одинаковыми параметрами,
+    # иначе значение считается точно по таблицам.
+    # Удаления сводка не учитывает, пока таблица не будет перестроена:
+    # после remove оценки смещены вверх
+    def approx_len(self) -> float:
+        """Возвращает оценку количества значений"""
+        if self._sketch is None:
+            return float(len(self))
+        return self._sketch.estimate_len()
+
+    def approx_union_len(self, other: PowerSet[T]) -> float:
+        """Возвращает оценку размера объединения с other"""
+        if not self._has_sketch_like(other):
+            return float(len(self.union(other)))
+        return self._sketch.estimate_union_len(other._sketch)
+
+    def approx_jaccard(self, other: PowerSet[T]) -> float:
+        """Возвращает оценку коэффициента Жаккара |A & B| / |A | B|"""
+        if not self._has_sketch_like(other):
+            union_len = len(self.union(other))
+            return len(self.intersection(other)) / union_len if union_len else 1.0
+        return self._sketch.estimate_jaccard(other._sketch)
+
+    def freeze(self) -> FrozenPowerSet[T]:
+        """
+        Возвращает неизменяемую копию множества на отсортированном массиве.
+        Предусловие: значения попарно сравнимы
+        """
+        return FrozenPowerSet._from_sorted(sorted(self))
+
+    # Команды
+    def update(self, other: AbstractPowerSet[T]) -> None:
+        if other is self:
+            return
+        self._reserve(len(self) + len(other))
+        for item in other:
+            self.put(item)
+
+    def intersection_update(self, other: AbstractPowerSet[T]) -> None:
+        if other is self:
+            return
+        if len(other) < len(self):
+            # Другое множество меньше: общие значения собираются по нему
+            # и раскладываются в таблицу заново
+            self._rebuild(self._table_size, [item for item in other if self.isin(item)])
+            return
+        for item in [item for item in self if not other.isin(item)]:
+            self.remove(item)
+
+    def difference_update(self, other: AbstractPowerSet[T]) -> None:
+        if other is self:
+            self.clear()
+            return
+        if len(other) <= len(self):
+            for item in other:
+                if self.isin(item):
+                    self.remove(item)
+            return
+        for item in [item for item in self if other.isin(item)]:
+            self.remove(item)
+
+    def __ior__(self, other: AbstractPowerSet[T]) -> PowerSet[T]:
+        self.update(other)
+        return self
+
+    def __iand__(self, other: AbstractPowerSet[T]) -> PowerSet[T]:
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other: AbstractPowerSet[T]) -> PowerSet[T]:
+        self.difference_update(other)
+        return self
+
+    # Вспомогательные функции
+    def _has_sketch_like(self, other: AbstractPowerSet[T]) -> bool:
+        return (
+            self._sketch is not None
+            and isinstance(other, PowerSet)
+            and other._sketch is not None
+            and self._sketch.is_compatible(other._sketch)
+        )
+
+    def _copy(self, max_size: int) -> PowerSet[T]:
+        new_set = super()._copy(max_size)
+        if self._sketch is not None:
+            new_set._sketch = self._sketch.copy()
+            new_set._sketch_stale = self._sketch_stale
+        return new_set
+
+    def _rebuild(self, table_size: int, items: list[T] | None = None) -> None:
+        # Перестройка обходит все значения: если в сводке есть удаленные
+        # (или items заменяют часть значений), сводка заодно пересчитывается.
+        # Простой рост таблицы в _reserve сводку не трогает
+        super()._rebuild(table_size, items)
+        if self._sketch is not None and (self._sketch_stale or items is not None):
+            self._sketch = SetSketch(self._sketch_params[1], self._sketch_params[2])
+            for item in self:
+                self._sketch.add(item)
+            self._sketch_stale = False
+
+    def _empty(self, max_size: int) -> PowerSet[T]:
+        return type(self)(max_size, *self._sketch_params)
+
+
+class BitsetPowerSet(AbstractPowerSet, Generic[T]):
+    """
+    Множество целых чисел из плотного диапазона [0, max_size),
+    хранящееся как битовый массив: бит i установлен, если i во множестве.
+    Операции над двумя такими множествами выполняются побитово над целыми словами
+    """
+    PUT_OK = 0
+    PUT_ERR = 1
+    DELETE_OK = 0
+    DELETE_ERR = 1
+
+    # Конструктор
+    def __init__(self, max_size: int) -> None:
+        """
+        Постусловие: создано пустое множество над универсумом [0, max_size)
+        """
+        assert max_size >= 0, "Размер универсума - неотрицательное число"
+        self._max_size = max_size
+        # Длина кратна 8 байтам, чтобы обходить карту 64-битными словами
+        self._bits = bytearray(((max_size + 63) >> 6) << 3)
+        self._count = 0
+        self._put_status = self.PUT_OK
+        self._delete_status = self.DELETE_OK
+
+    # Команды
+    def put(self, value: T) -> None:
+        if not self._in_universe(value):
+            self._put_status = self.PUT_ERR
+            return
+        mask = 1 << (value & 7)
+        if not self._bits[value >> 3] & mask:
+            self._bits[value >> 3] |= mask
+            self._count += 1
+        self._put_status = self.PUT_OK
+
+    def remove(self, value: T) -> None:
+        if not self.isin(value):
+            self._delete_status = self.DELETE_ERR
+            return
+        self._bits[value >> 3] &= ~(1 << (value & 7))
+        self._count -= 1
+        self._delete_status = self.DELETE_OK
+
+    def clear(self) -> None:
+        self.__init__(self._max_size)
+
+    # Запросы
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[T]:
+        return _iter_bits(self._bits)
+
+    def isin(self, value: T) -> bool:
+        return self._in_universe(value) and bool(self._bits[value >> 3] & (1 << (value & 7)))
+
+    def get_max_size(self) -> int:
+        """Возвращает размер универсума"""
+        return self._max_size
+
+    def get_put_status(self) -> int:
+        return self._put_status
+
+    def get_delete_status(self) -> int:
+        return self._delete_status
+
+    def intersection(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        if isinstance(other, BitsetPowerSet):
+            max_size = min(self._max_size, other._max_size)
+            return self._from_int(max_size, self._as_int() & other._as_int())
+        # Пересечение - подмножество текущего, поэтому помещается в его универсум
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        new_set = BitsetPowerSet(self._max_size)
+        for item in small:
+            if large.isin(item):
                 new_set.put(item)
         return new_set
 
+    def union(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        if isinstance(other, BitsetPowerSet):
+            max_size = max(self._max_size, other._max_size)
+            return self._from_int(max_size, self._as_int() | other._as_int())
+        # Значения другого множества могут не попасть в универсум:
+        # результат строится хэш-таблицей
+        return other.union(self)
+
+    def difference(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        if isinstance(other, BitsetPowerSet):
+            return self._from_int(self._max_size, self._as_int() & ~other._as_int())
+        new_set = self._from_int(self._max_size, self._as_int())
+        if len(other) < len(self):
+            for item in other:
+                if new_set.isin(item):
+                    new_set.remove(item)
+        else:
+            for item in self:
+                if other.isin(item):
+                    new_set.remove(item)
+        return new_set
+
     def issubset(self, other: AbstractPowerSet[T]) -> bool:
-        return all(other.isin(item) for item in self._array)
+        if isinstance(other, BitsetPowerSet):
+            return self._as_int() & ~other._as_int() == 0
+        if len(self) > len(other):
+            return False
+        return all(other.isin(item) for item in self)
+
+    def union_all(self, *others: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        sets = (self,) + others
+        if all(isinstance(item, BitsetPowerSet) for item in sets):
+            bits = 0
+            for item in sets:
+                bits |= item._as_int()
+            return self._from_int(max(item._max_size for item in sets), bits)
+        # Есть множество на хэш-таблице: объединение строит оно
+        table = next(item for item in sets if not isinstance(item, BitsetPowerSet))
+        return table.union_all(*(item for item in sets if item is not table))
+
+    # Команды
+    # Значения вне универсума в update не добавляются, статус put - PUT_ERR.
+    # Универсум расширяется только при объединении с большим битовым множеством
+    def update(self, other: AbstractPowerSet[T]) -> None:
+        if isinstance(other, BitsetPowerSet):
+            if other._max_size > self._max_size:
+                self._bits.extend(bytes(len(other._bits) - len(self._bits)))
+                self._max_size = other._max_size
+            self._assign_int(self._as_int() | other._as_int())
+            return
+        status = self.PUT_OK
+        for item in other:
+            self.put(item)
+            status = max(status, self._put_status)
+        self._put_status = status
+
+    def intersection_update(self, other: AbstractPowerSet[T]) -> None:
+        if isinstance(other, BitsetPowerSet):
+            self._assign_int(self._as_int() & other._as_int())
+            return
+        if len(other) < len(self):
+            kept = [item for item in other if self.isin(item)]
+            self._bits[:] = bytes(len(self._bits))
+            self._count = 0
+            for item in kept:
+                self.put(item)
+            return
+        for item in [item for item in self if not other.isin(item)]:
+            self.remove(item)
+
+    def difference_update(self, other: AbstractPowerSet[T]) -> None:
+        if isinstance(other, BitsetPowerSet):
+            self._assign_int(self._as_int() & ~other._as_int())
+            return
+        if len(other) <= len(self):
+            for item in other:
+                if self.isin(item):
+                    self.remove(item)
+            return
+        for item in [item for item in self if other.isin(item)]:
+            self.remove(item)
+
+    def __ior__(self, other: AbstractPowerSet[T]) -> BitsetPowerSet[T]:
+        self.update(other)
+        return self
+
+    def __iand__(self, other: AbstractPowerSet[T]) -> BitsetPowerSet[T]:
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other: AbstractPowerSet[T]) -> BitsetPowerSet[T]:
+        self.difference_update(other)
+        return self
+
+    # Вспомогательные функции
+    def _in_universe(self, value: T) -> bool:
+        return isinstance(value, int) and 0 <= value < self._max_size
+
+    def _as_int(self) -> int:
+        """
+        Битовый массив как одно целое: побитовые операции над ним
+        выполняются в C по машинным словам
+        """
+        return int.from_bytes(self._bits, 'little')
+
+    def _assign_int(self, bits: int) -> None:
+        self._bits[:] = bits.to_bytes(len(self._bits), 'little')
+        self._count = bits.bit_count()
+
+    @classmethod
+    def _from_int(cls, max_size: int, bits: int) -> BitsetPowerSet[T]:
+        new_set = cls(max_size)
+        new_set._bits[:] = bits.to_bytes(len(new_set._bits), 'little')
+        new_set._count = bits.bit_count()
+        return new_set
+
+
+class FrozenPowerSet(AbstractPowerSet, Generic[T]):
+    """
+    Неизменяемое множество на отсортированном массиве, создается PowerSet.freeze().
+    isin - двоичный поиск, операции над двумя такими множествами - слияние
+    с галопом: серии подряд идущих значений одного массива пропускаются
+    или копируются срезом за O(log длины серии)
+    """
+    PUT_OK = 0
+    PUT_ERR = 1
+    DELETE_OK = 0
+    DELETE_ERR = 1
+
+    # Конструктор
+    def __init__(self, max_size: int = 0) -> None:
+        """
+        Постусловие: создано пустое множество
+        """
+        self._items: list[T] = []
+        self._put_status = self.PUT_OK
+        self._delete_status = self.DELETE_OK
+
+    # Команды
+    # Множество неизменяемо: команды только выставляют статус ошибки
+    def put(self, value: T) -> None:
+        self._put_status = self.PUT_ERR
+
+    def remove(self, value: T) -> None:
+        self._delete_status = self.DELETE_ERR
+
+    def clear(self) -> None:
+        self._delete_status = self.DELETE_ERR
+
+    def update(self, other: AbstractPowerSet[T]) -> None:
+        self._put_status = self.PUT_ERR
+
+    def intersection_update(self, other: AbstractPowerSet[T]) -> None:
+        self._delete_status = self.DELETE_ERR
+
+    def difference_update(self, other: AbstractPowerSet[T]) -> None:
+        self._delete_status = self.DELETE_ERR
+
+    # Запросы
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def isin(self, value: T) -> bool:
+        items = self._items
+        index = bisect_left(items, value)
+        return index < len(items) and items[index] == value
+
+    def get_put_status(self) -> int:
+        return self._put_status
+
+    def get_delete_status(self) -> int:
+        return self._delete_status
+
+    def intersection(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        small, large = self._items, self._sorted(other)
+        if len(small) > len(large):
+            small, large = large, small
+        result = []
+        index = 0
+        for item in small:
+            index = _gallop(large, item, index)
+            if index == len(large):
+                break
+            if large[index] == item:
+                result.append(item)
+        return self._from_sorted(result)
+
+    def union(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        left, right = self._items, self._sorted(other)
+        result = []
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                end = _gallop(left, right[j], i)
+                result.extend(left[i:end])
+                i = end
+            elif right[j] < left[i]:
+                end = _gallop(right, left[i], j)
+                result.extend(right[j:end])
+                j = end
+            else:
+                result.append(left[i])
+                i += 1
+                j += 1
+        result.extend(left[i:])
+        result.extend(right[j:])
+        return self._from_sorted(result)
+
+    def difference(self, other: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        left, right = self._items, self._sorted(other)
+        result = []
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                end = _gallop(left, right[j], i)
+                result.extend(left[i:end])
+                i = end
+            elif right[j] < left[i]:
+                j = _gallop(right, left[i], j)
+            else:
+                i += 1
+                j += 1
+        result.extend(left[i:])
+        return self._from_sorted(result)
+
+    def issubset(self, other: AbstractPowerSet[T]) -> bool:
+        if len(self) > len(other):
+            return False
+        if not isinstance(other, FrozenPowerSet):
+            return all(other.isin(item) for item in self._items)
+        items = other._items
+        index = 0
+        for item in self._items:
+            index = _gallop(items, item, index)
+            if index == len(items) or items[index] != item:
+                return False
+        return True
+
+    def union_all(self, *others: AbstractPowerSet[T]) -> AbstractPowerSet[T]:
+        result = []
+        for item in merge(self._items, *(self._sorted(other) for other in others)):
+            if not result or result[-1] != item:
+                result.append(item)
+        return self._from_sorted(result)
+
+    # Вспомогательные функции
+    @staticmethod
+    def _sorted(other: AbstractPowerSet[T]) -> list[T]:
+        if isinstance(other, FrozenPowerSet):
+            return other._items
+        return sorted(other)
+
+    @classmethod
+    def _from_sorted(cls, items: list[T]) -> FrozenPowerSet[T]:
+        new_set = cls()
+        new_set._items = items
+        return new_set
+
+
+def _gallop(items: list[T], value: T, lo: int) -> int:
+    """
+    Индекс первого элемента items[lo:] не меньше value.
+    Граница ищется шагами 1, 2, 4, ..., затем двоичным поиском внутри шага:
+    O(log d), где d - расстояние от lo до ответа
+    """
+    step = 1
+    hi = lo
+    while hi < len(items) and items[hi] < value:
+        lo = hi + 1
+        hi += step
+        step <<= 1
+    return bisect_left(items, value, lo, min(hi, len(items)))
+
+
+def make_power_set(max_size: int, dense: bool = False) -> AbstractPowerSet:
+    """
+    Создает множество на max_size значений.
+    dense=True - битовое множество для целых из [0, max_size),
+    иначе - множество на хэш-таблице для произвольных значений
+    """
+    if dense:
+        return BitsetPowerSet(max_size)
+    return PowerSet(max_size)
+
+
+def _benchmark() -> None:
+    """
+    Операции над множествами разного размера: время зависит от меньшего
+    """
+    import time
+
+    large = PowerSet(10 ** 5)
+    for i in range(10 ** 5):
+        large.put(i)
+    for small_len in (10, 10 ** 3, 10 ** 5):
+        small = PowerSet(small_len)
+        for i in range(0, 2 * small_len, 2):
+            small.put(i)
+        for name in ('intersection', 'difference', 'issubset'):
+            start = time.perf_counter()
+            if name == 'issubset':
+                small.issubset(large)
+            else:
+                getattr(large, name)(small)
+            elapsed = time.perf_counter() - start
+            print(f"{name} 10^5 и {small_len}: {elapsed * 1000:.2f} мс")
+
+    # Плотные целые: хэш-таблица против битового множества
+    n = 10 ** 6
+    for dense in (False, True):
+        first = make_power_set(n, dense)
+        second = make_power_set(n, dense)
+        for i in range(0, n, 2):
+            first.put(i)
+        for i in range(0, n, 3):
+            second.put(i)
+        start = time.perf_counter()
+        first.union(second)
+        first.intersection(second)
+        first.difference(second)
+        first.issubset(second)
+        elapsed = time.perf_counter() - start
+        kind = "BitsetPowerSet" if dense else "PowerSet"
+        print(f"{kind}, 10^6: union+intersection+difference+issubset {elapsed * 1000:.1f} мс")
+
+    # Цикл объединений: новый объект на каждом шаге против объединения на месте
+    chunks = []
+    for i in range(200):
+        chunk = PowerSet(500)
+        for j in range(i * 250, i * 250 + 500):
+            chunk.put(j)
+        chunks.append(chunk)
+    start = time.perf_counter()
+    acc = PowerSet(0)
+    for chunk in chunks:
+        acc = acc.union(chunk)
+    union_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    acc = PowerSet(0)
+    for chunk in chunks:
+        acc |= chunk
+    update_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    PowerSet(0).union_all(*chunks)
+    union_all_elapsed = time.perf_counter() - start
+    print(
+        f"200 объединений: union {union_elapsed * 1000:.1f} мс, "
+        f"|= {update_elapsed * 1000:.1f} мс, union_all {union_all_elapsed * 1000:.1f} мс"
+    )
+
+    # Хэш-таблица против отсортированного массива при соотношениях размеров 1:1 ... 1:10000
+    n = 10 ** 5
+    large = PowerSet(n)
+    for i in range(0, 2 * n, 2):
+        large.put(i)
+    frozen_large = large.freeze()
+    for ratio in (1, 10, 100, 1000, 10000):
+        small = PowerSet(n // ratio)
+        for i in range(0, 3 * (n // ratio), 3):
+            small.put(i)
+        frozen_small = small.freeze()
+        for name in ('intersection', 'union', 'difference'):
+            start = time.perf_counter()
+            getattr(large, name)(small)
+            hash_elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            getattr(frozen_large, name)(frozen_small)
+            frozen_elapsed = time.perf_counter() - start
+            print(
+                f"1:{ratio} {name}: PowerSet {hash_elapsed * 1000:.2f} мс, "
+                f"FrozenPowerSet {frozen_elapsed * 1000:.2f} мс"
+            )
+
+    # Размер объединения и коэффициент Жаккара: сводки против построения объединения
+    first = PowerSet(n, sketch=True)
+    second = PowerSet(n, sketch=True)
+    for i in range(n):
+        first.put(i)
+        second.put(i + n // 2)
+    start = time.perf_counter()
+    exact = len(first.union(second))
+    exact_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    approx = first.approx_union_len(second)
+    jaccard = first.approx_jaccard(second)
+    approx_elapsed = time.perf_counter() - start
+    print(
+        f"|A | B| = {exact} за {exact_elapsed * 1000:.1f} мс, "
+        f"оценка {approx:.0f} (Жаккар {jaccard:.3f}) за {approx_elapsed * 1000:.1f} мс"
+    )
+
 
+if __name__ == '__main__':
+    _benchmark()